@@ -0,0 +1,90 @@
+"""Benchmark JSON decoder backends on a synthetic Smile export.
+
+Usage (from the analysis folder):
+
+    uv run python benchmarks/bench_backends.py [--participants 10000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from smiledata import load_json
+from smiledata.backends import available_backends
+
+
+def make_participant(i: int, rng: random.Random) -> dict:
+    """Build one synthetic participant with nested pageData_* routes."""
+    trials = {
+        f"visit_{v}": {
+            "timestamps": [1700000000000 + t for t in range(40)],
+            "data": [
+                {
+                    "trial": t,
+                    "stimulus": f"img_{rng.randrange(100)}.png",
+                    "response": rng.choice(["left", "right"]),
+                    "rt": rng.uniform(200, 1500),
+                    "correct": rng.random() > 0.2,
+                    "persist": {"attempts": v + 1, "angles": [0, 90, 180]},
+                }
+                for t in range(40)
+            ],
+        }
+        for v in range(2)
+    }
+    return {
+        "id": f"participant-{i}",
+        "seedID": f"seed-{i}",
+        "consented": True,
+        "withdrawn": rng.random() < 0.05,
+        "done": rng.random() > 0.1,
+        "recruitmentService": rng.choice(["prolific", "mturk", "web"]),
+        "conditions": {"condition": rng.choice("AB"), "block_order": rng.choice("12")},
+        "smileConfig": {"projectName": "bench", "github": {"branch": "main", "repo": "bench"}},
+        "browserData": [{"event_type": "resize", "timestamp": 1700000000 + e} for e in range(5)],
+        "routeOrder": [{"route": r, "timeDelta": 1000} for r in ("consent", "exp", "thanks")],
+        "pageData_demograph": {"visit_0": {"timestamps": [1], "data": [{"age": "30"}]}},
+        "pageData_experiment": trials,
+        "userTimezone": "America/New_York",
+    }
+
+
+def main() -> None:
+    """Write a synthetic export and time load_json() with each backend."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--participants", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "synthetic.json"
+        path.write_text(json.dumps([make_participant(i, rng) for i in range(args.participants)]))
+        size_mb = path.stat().st_size / 1e6
+        print(f"{args.participants} participants, {size_mb:.1f} MB")
+
+        timings = {}
+        for backend in available_backends():
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                dataset = load_json(path, backend=backend)
+                best = min(best, time.perf_counter() - start)
+                # Free the previous result outside the timed region
+                del dataset
+                gc.collect()
+            timings[backend] = best
+
+        baseline = timings["json"]
+        for backend, seconds in timings.items():
+            print(f"  {backend:<10} {seconds:7.3f}s  {baseline / seconds:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ Uses Polars for fast DataFrame operations.
 """
 
 from .dataset import SmileDataset
-from .loader import load_folder, load_json, load_latest
+from .loader import IncrementalLoader, iter_participants, load_folder, load_json, load_latest
 from .participant import Participant
 from .plotting import detect_theme, get_theme_colors
 
@@ -14,8 +14,10 @@ __all__ = [
     "SmileDataset",
     "Participant",
     "load_json",
+    "iter_participants",
     "load_folder",
     "load_latest",
+    "IncrementalLoader",
     "detect_theme",
     "get_theme_colors",
 ]
@@ -0,0 +1,180 @@
+"""Pluggable JSON decoder backends for loading exports."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Sequence
+from functools import cache
+from typing import Any, cast
+
+Decoder = Callable[[bytes | str], Any]
+
+# Backends in order of preference when choosing automatically
+BACKEND_PREFERENCE = ("orjson", "msgspec", "simdjson", "json")
+
+# Backends that decode straight from a memoryview without copying it
+BUFFER_BACKENDS = frozenset({"orjson", "msgspec", "simdjson"})
+
+
+def _orjson_decoder() -> Decoder:
+    """Decoder using orjson (raises a json.JSONDecodeError subclass)."""
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec_decoder() -> Decoder:
+    """Decoder using msgspec, with errors mapped to json.JSONDecodeError."""
+    import msgspec
+
+    decode_json = msgspec.json.Decoder().decode
+
+    def decode(buf: bytes | str) -> Any:
+        try:
+            return decode_json(buf)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+
+    return decode
+
+
+def _simdjson_decoder() -> Decoder:
+    """Decoder using pysimdjson, with errors mapped to json.JSONDecodeError."""
+    import simdjson
+
+    def decode(buf: bytes | str) -> Any:
+        try:
+            return simdjson.loads(buf)
+        except ValueError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+
+    return decode
+
+
+def _stdlib_decoder() -> Decoder:
+    """Decoder using the standard library json module."""
+    return json.loads
+
+
+_BACKENDS: dict[str, Callable[[], Decoder]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "simdjson": _simdjson_decoder,
+    "json": _stdlib_decoder,
+}
+
+
+@cache
+def _load_backend(name: str) -> Decoder | None:
+    """Import a backend, or return None if it is not installed."""
+    try:
+        return _BACKENDS[name]()
+    except ImportError:
+        return None
+
+
+def available_backends() -> list[str]:
+    """Return the installed JSON backends, fastest first.
+
+    Returns:
+        Backend names; always ends with the stdlib 'json' backend.
+    """
+    return [name for name in BACKEND_PREFERENCE if _load_backend(name) is not None]
+
+
+def resolve_backend(backend: str | None = None) -> str:
+    """Resolve a backend name, choosing the fastest installed one by default.
+
+    Args:
+        backend: Backend name ('orjson', 'msgspec', 'simdjson' or 'json'),
+            or None/'auto' to pick the fastest installed backend.
+
+    Returns:
+        The name of the backend to use.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    if backend is None or backend == "auto":
+        return available_backends()[0]
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend {backend!r}. Choose from: {', '.join(BACKEND_PREFERENCE)}"
+        )
+    if _load_backend(backend) is None:
+        raise ImportError(f"JSON backend {backend!r} is not installed")
+    return backend
+
+
+def supports_buffers(backend: str | None = None) -> bool:
+    """Whether a backend can decode a memoryview without copying it first.
+
+    Args:
+        backend: Backend name, or None/'auto' for the fastest installed one.
+
+    Returns:
+        True if the backend accepts buffers such as memory-mapped files.
+    """
+    return resolve_backend(backend) in BUFFER_BACKENDS
+
+
+def get_decoder(backend: str | None = None) -> Decoder:
+    """Return a decode function for a JSON backend.
+
+    Every decoder accepts bytes or str and raises json.JSONDecodeError on
+    invalid input, whichever backend is used.
+
+    Args:
+        backend: Backend name, or None/'auto' for the fastest installed one.
+
+    Returns:
+        Function that decodes a JSON document.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    return cast(Decoder, _load_backend(resolve_backend(backend)))
+
+
+def get_projecting_decoder(keys: Sequence[str]) -> Decoder:
+    """Return a decoder for export arrays that keeps only some top-level keys.
+
+    Uses msgspec's schema-driven decoding, which skips the values of all
+    other keys without building Python objects for them.
+
+    Args:
+        keys: Top-level participant keys to keep.
+
+    Returns:
+        Function that decodes a JSON array of participant objects into a list
+        of dicts holding only the requested keys that are present.
+
+    Raises:
+        ImportError: If msgspec is not installed.
+    """
+    import msgspec
+
+    # Generated attribute names avoid clashes with keys that are not identifiers
+    names = [f"f{i}" for i in range(len(keys))]
+    record_type = msgspec.defstruct(
+        "Record",
+        [(name, Any, msgspec.UNSET) for name in names],
+        rename=dict(zip(names, keys)),
+    )
+    decode_json = msgspec.json.Decoder(list[record_type]).decode
+    unset = msgspec.UNSET
+    astuple = msgspec.structs.astuple
+
+    def decode(buf: bytes | str) -> Any:
+        try:
+            records = decode_json(buf)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+        return [
+            {key: value for key, value in zip(keys, astuple(r)) if value is not unset}
+            for r in records
+        ]
+
+    return decode
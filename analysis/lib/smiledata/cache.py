@@ -0,0 +1,142 @@
+"""On-disk columnar cache of parsed export files."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from .columnar import dataset_from_table, dataset_to_table, decode_coerced, encode_coerced
+from .dataset import SmileDataset
+
+CACHE_DIR_NAME = ".smilecache"
+
+# Bump when the cache file layout changes so old entries are rebuilt
+_CACHE_VERSION = 2
+
+
+def default_cache_dir(path: str | Path) -> Path:
+    """Return the default cache folder for an export file.
+
+    Args:
+        path: Path to the export file.
+
+    Returns:
+        A '.smilecache' folder next to the export.
+    """
+    return Path(path).parent / CACHE_DIR_NAME
+
+
+def _content_hash(path: Path) -> str:
+    """Hash the contents of a file."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()
+
+
+def _cache_files(path: Path, cache_dir: Path, variant: str = "") -> tuple[Path, Path]:
+    """Return the (data, metadata) cache file paths for an export."""
+    key = f"{path.resolve()}\0{variant}"
+    key = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    stem = f"{path.name}.{key}"
+    # Not '.json', so the metadata is never mistaken for an export
+    return cache_dir / f"{stem}.arrow", cache_dir / f"{stem}.meta"
+
+
+def _read_meta(meta_file: Path) -> dict[str, Any] | None:
+    """Read a cache metadata file, or None if missing or unreadable."""
+    try:
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != _CACHE_VERSION:
+        return None
+    return meta
+
+
+def _write_meta(
+    meta_file: Path, path: Path, stat: os.stat_result, content_hash: str, coerced: str
+) -> None:
+    """Write the metadata describing the export a cache entry was built from.
+
+    Args:
+        meta_file: Metadata file to write.
+        path: Export the entry was built from.
+        stat: The export's stat result.
+        content_hash: Hash of the export's contents.
+        coerced: The table's coerced condition keys (see encode_coerced()).
+    """
+    meta = {
+        "version": _CACHE_VERSION,
+        "path": str(path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hash": content_hash,
+        "coerced_conditions": coerced,
+    }
+    meta_file.write_text(json.dumps(meta), encoding="utf-8")
+
+
+def load_cached(
+    path: str | Path,
+    load: Callable[[Path], SmileDataset],
+    cache_dir: str | Path | None = None,
+    variant: str = "",
+) -> SmileDataset:
+    """Load an export through the on-disk cache.
+
+    Each export is cached as an Arrow IPC file holding the participant-level
+    metadata columns plus one encoded raw record per participant, so a cache
+    hit is a memory-mapped read and records are only decoded on access.
+
+    A cache entry is reused when the export's size and modification time
+    match the ones it was built from, or when only the modification time
+    changed but the content hash still matches. Otherwise the export is
+    parsed with ``load`` and the entry is rebuilt.
+
+    Args:
+        path: Path to the export file.
+        load: Function that parses the export into a SmileDataset.
+        cache_dir: Folder for cache files. Defaults to default_cache_dir(path).
+        variant: Extra cache key for loads of the same file that produce
+            different datasets (e.g. with a field projection).
+
+    Returns:
+        SmileDataset for the export.
+
+    Raises:
+        FileNotFoundError: If the export does not exist.
+    """
+    path = Path(path)
+    cache_dir = default_cache_dir(path) if cache_dir is None else Path(cache_dir)
+    data_file, meta_file = _cache_files(path, cache_dir, variant)
+    stat = path.stat()
+
+    meta = _read_meta(meta_file)
+    if meta is not None and meta["size"] == stat.st_size and data_file.exists():
+        fresh = meta["mtime_ns"] == stat.st_mtime_ns
+        if not fresh and meta["hash"] == _content_hash(path):
+            # Touched but unchanged: remember the new mtime to skip hashing next time
+            _write_meta(meta_file, path, stat, meta["hash"], meta["coerced_conditions"])
+            fresh = True
+        if fresh:
+            try:
+                coerced = decode_coerced(meta["coerced_conditions"])
+                return dataset_from_table(pl.read_ipc(data_file), coerced)
+            except (OSError, pl.exceptions.PolarsError):
+                pass  # Unreadable entry, rebuild below
+
+    content_hash = _content_hash(path)
+    dataset = load(path)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_file = data_file.with_suffix(".tmp")
+    table, coerced = dataset_to_table(dataset)
+    table.write_ipc(tmp_file, compression="uncompressed")
+    os.replace(tmp_file, data_file)
+    _write_meta(meta_file, path, stat, content_hash, encode_coerced(coerced))
+    return dataset
@@ -0,0 +1,175 @@
+"""Columnar (Arrow/Parquet) storage of datasets."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import polars as pl
+import pyarrow.parquet as pq
+
+from .dataset import SmileDataset
+from .lazy import LazyParticipants
+
+# Column holding each participant's JSON-encoded raw record
+RAW_COLUMN = "raw"
+
+PARTICIPANTS_FILE = "participants.parquet"
+DEMOGRAPHICS_FILE = "demographics.parquet"
+TRIALS_FILE = "trials.parquet"
+PAGE_DATA_DIR = "page_data"
+
+# Schema metadata key listing the condition keys coerced to strings
+COERCED_METADATA_KEY = "smiledata.coerced_conditions"
+
+
+def dataset_to_table(dataset: SmileDataset) -> tuple[pl.DataFrame, frozenset[str] | None]:
+    """Flatten a dataset into a participant table with raw records.
+
+    Args:
+        dataset: Dataset to flatten.
+
+    Returns:
+        Tuple of (table, coerced). The table has the to_participants_df()
+        columns plus a Binary 'raw' column holding each participant's
+        JSON-encoded record. coerced names the conditions whose column holds
+        mixed-type values coerced to strings, or is None if unknown; store
+        it with the table and pass it back to dataset_from_table().
+    """
+    frame, coerced = dataset._participants_table()
+    raw = pl.Series(
+        RAW_COLUMN, [json.dumps(p.raw_data).encode() for p in dataset], dtype=pl.Binary
+    )
+    return frame.with_columns(raw), coerced
+
+
+def dataset_from_table(
+    table: pl.DataFrame, coerced: frozenset[str] | None = None
+) -> SmileDataset:
+    """Rebuild a dataset from a table written by dataset_to_table().
+
+    Participants are decoded lazily from the raw column on access, and the
+    remaining columns back the dataset's participant-level table, so counts,
+    built-in filters and the condition index never need to decode a record
+    (except for conditions listed in ``coerced``).
+
+    Args:
+        table: Participant table with a 'raw' column.
+        coerced: Condition keys coerced to strings in the table, as returned
+            by dataset_to_table(), or None if unknown.
+
+    Returns:
+        Columnar-backed SmileDataset backed by the table's raw records.
+    """
+    dataset = SmileDataset(LazyParticipants(table[RAW_COLUMN]), frame=table.drop(RAW_COLUMN))
+    dataset._coerced = coerced
+    return dataset
+
+
+def encode_coerced(coerced: frozenset[str] | None) -> str:
+    """Serialize coerced condition keys for storage next to a table."""
+    return json.dumps(None if coerced is None else sorted(coerced))
+
+
+def decode_coerced(text: str | bytes | None) -> frozenset[str] | None:
+    """Parse coerced condition keys written by encode_coerced()."""
+    keys = None if text is None else json.loads(text)
+    return None if keys is None else frozenset(keys)
+
+
+def page_data_path(directory: str | Path, page_name: str) -> Path:
+    """Return the Parquet file holding one page's data in a dataset directory.
+
+    Args:
+        directory: Directory written by write_parquet().
+        page_name: The page/route name (without 'pageData_' prefix).
+
+    Returns:
+        Path to the page's Parquet file (Hive-style 'page=<name>' partition).
+    """
+    return Path(directory) / PAGE_DATA_DIR / f"page={page_name}" / "part-0.parquet"
+
+
+def write_parquet(dataset: SmileDataset, directory: str | Path) -> None:
+    """Write a dataset to a directory of Parquet tables.
+
+    Layout::
+
+        participants.parquet           one row per participant, plus raw records
+        demographics.parquet           demographics_df()
+        trials.parquet                 studyData trials, if any
+        page_data/page=<name>/*.parquet  to_page_data_df(name) for each page
+
+    Existing tables in the directory are replaced.
+
+    Args:
+        dataset: Dataset to write.
+        directory: Output directory (created if needed).
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    table, coerced = dataset_to_table(dataset)
+    arrow_table = table.to_arrow()
+    metadata = {**(arrow_table.schema.metadata or {}), COERCED_METADATA_KEY: encode_coerced(coerced)}
+    pq.write_table(
+        arrow_table.replace_schema_metadata(metadata),
+        directory / PARTICIPANTS_FILE,
+        compression="zstd",
+    )
+    dataset.demographics_df().write_parquet(directory / DEMOGRAPHICS_FILE)
+
+    trials_file = directory / TRIALS_FILE
+    trials_file.unlink(missing_ok=True)
+    if any(p.study_data for p in dataset):
+        dataset.to_trials_df().write_parquet(trials_file)
+
+    # Drop partitions of pages that may no longer exist
+    shutil.rmtree(directory / PAGE_DATA_DIR, ignore_errors=True)
+    for page_name, page_df in dataset.to_page_data_dfs().items():
+        page_file = page_data_path(directory, page_name)
+        page_file.parent.mkdir(parents=True)
+        page_df.write_parquet(page_file)
+
+
+def read_parquet(directory: str | Path) -> SmileDataset:
+    """Read a dataset written by write_parquet().
+
+    Only the participant table is read; participants are rebuilt lazily from
+    their raw records when accessed.
+
+    Args:
+        directory: Directory written by write_parquet().
+
+    Returns:
+        SmileDataset with the stored participants.
+
+    Raises:
+        FileNotFoundError: If the directory has no participants table.
+    """
+    participants_file = Path(directory) / PARTICIPANTS_FILE
+    if not participants_file.exists():
+        raise FileNotFoundError(f"No {PARTICIPANTS_FILE} found in {directory}")
+    metadata = pq.read_schema(participants_file).metadata or {}
+    coerced = decode_coerced(metadata.get(COERCED_METADATA_KEY.encode()))
+    dataset = dataset_from_table(pl.read_parquet(participants_file), coerced)
+    # Remember the stored tables so trial queries can scan them
+    dataset._store = Path(directory)
+    return dataset
+
+
+def trials_path(directory: str | Path, page: str | None = None) -> Path:
+    """Return the path of a stored trial table.
+
+    Args:
+        directory: Directory written by write_parquet().
+        page: Page name, or None for the studyData trials table.
+
+    Returns:
+        Path to the table's Parquet file (which may not exist if there was
+        no data).
+    """
+    if page is None:
+        return Path(directory) / TRIALS_FILE
+    return page_data_path(directory, page)
@@ -2,12 +2,198 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
 from typing import Any, overload
 
 import polars as pl
 
-from .participant import Participant
+from .lazy import LazyParticipants
+from .participant import LEGACY_FORM_FIELDS, Participant
+from .transforms import (
+    SchemaDict,
+    encode_categoricals,
+    forms_to_df,
+    page_data_to_df,
+    page_data_to_dfs,
+    study_data_to_df,
+)
+
+
+class _ConditionIndex:
+    """Positions of participants by condition value and recruitment service.
+
+    Every participant appears under every condition key: participants
+    without a key are listed under None, matching how by_condition()
+    compares with ``conditions.get(key)``. Keys with unhashable values are
+    left to linear scans. Keys whose values were coerced to strings in a
+    participant table are re-indexed from the participants before use (see
+    reindex()).
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty index for a number of participants.
+
+        Args:
+            size: Number of participants.
+        """
+        self.size = size
+        self.conditions: dict[str, dict[Any, list[int]]] = {}
+        self.recruitment: dict[str, list[int]] = {}
+        self.unhashable: set[str] = set()
+        self.string_keys: set[str] = set()
+
+    @classmethod
+    def from_participants(cls, participants: Sequence[Participant]) -> _ConditionIndex:
+        """Build the index in one pass over the participants."""
+        index = cls(len(participants))
+        for i, p in enumerate(participants):
+            index.recruitment.setdefault(p.recruitment_service, []).append(i)
+            for key, value in p.conditions.items():
+                index._add(key, value, i)
+        index._add_missing()
+        return index
+
+    @classmethod
+    def from_frame(
+        cls, frame: pl.DataFrame, coerced: frozenset[str] | None = None
+    ) -> _ConditionIndex:
+        """Build the index from the columns of a participant table.
+
+        Args:
+            frame: Participant table, as returned by to_participants_df().
+            coerced: Condition keys whose column holds mixed-type values
+                coerced to strings. None treats every String column as
+                possibly coerced.
+        """
+        index = cls(frame.height)
+        if "recruitment_service" in frame.columns:
+            for i, service in enumerate(frame["recruitment_service"].to_list()):
+                index.recruitment.setdefault(service, []).append(i)
+        for column in frame.columns:
+            if not column.startswith("condition_"):
+                continue
+            key = column[len("condition_") :]
+            if frame[column].dtype == pl.String and (coerced is None or key in coerced):
+                index.string_keys.add(key)
+            for i, value in enumerate(frame[column].to_list()):
+                if value is not None:
+                    index._add(key, value, i)
+        index._add_missing()
+        return index
+
+    def _add(self, key: str, value: Any, position: int) -> None:
+        """Record that the participant at a position has a condition value."""
+        if key in self.unhashable:
+            return
+        values = self.conditions.setdefault(key, {})
+        try:
+            values.setdefault(value, []).append(position)
+        except TypeError:
+            self.unhashable.add(key)
+            del self.conditions[key]
+
+    def reindex(self, key: str, participants: Sequence[Participant]) -> None:
+        """Index a condition key from the participants' own values.
+
+        Args:
+            key: Condition name.
+            participants: The participants the index was built for.
+        """
+        self.string_keys.discard(key)
+        self.conditions.pop(key, None)
+        for i, p in enumerate(participants):
+            conditions = p.conditions
+            if key in conditions:
+                self._add(key, conditions[key], i)
+        self._add_missing([key])
+
+    def _add_missing(self, keys: Iterable[str] | None = None) -> None:
+        """List participants without a condition key under None.
+
+        Args:
+            keys: Condition names to fill in. Defaults to all of them.
+        """
+        for key in self.conditions if keys is None else keys:
+            values = self.conditions.get(key)
+            if values is None:
+                continue
+            present = {i for positions in values.values() for i in positions}
+            if len(present) < self.size:
+                missing = (i for i in range(self.size) if i not in present)
+                values[None] = sorted([*values.get(None, []), *missing])
+
+    def lookup(self, conditions: dict[str, Any]) -> list[int] | None:
+        """Return the positions of participants matching all conditions.
+
+        Args:
+            conditions: Condition name-value pairs to match.
+
+        Returns:
+            Matching positions in order, or None if the index cannot answer
+            the query exactly.
+        """
+        matches: list[list[int]] = []
+        for key, value in conditions.items():
+            if key in self.unhashable or key in self.string_keys:
+                return None
+            values = self.conditions.get(key)
+            if values is None:
+                # Nobody has this condition, so only None matches (everyone)
+                positions: list[int] = list(range(self.size)) if value is None else []
+            else:
+                try:
+                    positions = values.get(value, [])
+                except TypeError:
+                    return None
+            matches.append(positions)
+
+        if not matches:
+            return list(range(self.size))
+        if len(matches) == 1:
+            return list(matches[0])
+        matches.sort(key=len)
+        smallest, *rest = matches
+        keep = set(smallest)
+        for positions in rest:
+            keep.intersection_update(positions)
+        return sorted(keep)
+
+
+class _ParticipantView(Sequence[Participant]):
+    """Participants at some positions of a parent sequence, without copying."""
+
+    def __init__(self, base: Sequence[Participant], indices: pl.Series) -> None:
+        """Initialize from a parent sequence and positions into it.
+
+        Args:
+            base: Parent sequence of participants.
+            indices: Int64 Series of positions in ``base``, in view order.
+        """
+        self._base = base
+        self._indices = indices
+
+    def __len__(self) -> int:
+        """Return the number of participants."""
+        return len(self._indices)
+
+    def __iter__(self) -> Iterator[Participant]:
+        """Iterate over the participants in view order."""
+        base = self._base
+        for i in self._indices.to_list():
+            yield base[i]
+
+    @overload
+    def __getitem__(self, idx: int) -> Participant: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> _ParticipantView: ...
+
+    def __getitem__(self, idx: int | slice) -> Participant | _ParticipantView:
+        """Get a participant by index, or a narrower view by slice."""
+        if isinstance(idx, slice):
+            return _ParticipantView(self._base, self._indices[idx])
+        return self._base[self._indices[idx]]
 
 
 class SmileDataset:
@@ -15,15 +201,157 @@ class SmileDataset:
 
     Provides a convenient interface for working with multiple participants,
     including filtering, iteration, and conversion to DataFrames.
+
+    A dataset can optionally be columnar-backed: alongside the participants
+    it then holds their participant-level fields (the to_participants_df()
+    table) as a Polars DataFrame, and counts and the built-in filters run as
+    vectorized column operations instead of Python loops.
+
+    Slicing and filtering return views: datasets that hold only an index
+    array of positions into the dataset they were derived from, sharing its
+    participants, table and condition index. Use materialize() to copy a
+    view into a standalone dataset.
     """
 
-    def __init__(self, participants: list[Participant]) -> None:
+    def __init__(
+        self, participants: Sequence[Participant], frame: pl.DataFrame | None = None
+    ) -> None:
         """Initialize a dataset with a list of participants.
 
         Args:
-            participants: List of Participant objects.
+            participants: List (or other sequence, such as LazyParticipants)
+                of Participant objects.
+            frame: Optional participant-level table with one row per
+                participant, in the same order, as returned by
+                to_participants_df(). Makes the dataset columnar-backed.
         """
         self._participants = participants
+        self._frame_data = frame
+        # Views hold positions into their root dataset; roots have no indices
+        self._root = self
+        self._indices: pl.Series | None = None
+        # Directory of Parquet tables the dataset was read from, if any
+        self._store: Path | None = None
+        # Condition keys coerced to strings in the participant table; None if unknown
+        self._coerced: frozenset[str] | None = None
+        # Derived values, valid while the root's generation is unchanged
+        self._generation = 0
+        self._memo_values: dict[str, Any] = {}
+        self._memo_generation = 0
+
+    @classmethod
+    def _view(
+        cls, root: SmileDataset, indices: pl.Series, frame: pl.DataFrame | None = None
+    ) -> SmileDataset:
+        """Create a view of a root dataset.
+
+        Args:
+            root: Dataset that owns the participants (never itself a view).
+            indices: Int64 Series of positions in ``root``.
+            frame: Participant table of the view, if it has its own. Views
+                of a columnar root gather the root's table when first needed.
+
+        Returns:
+            SmileDataset sharing the root's participants.
+        """
+        view = cls(_ParticipantView(root._participants, indices), frame=frame)
+        view._root = root
+        view._indices = indices
+        return view
+
+    def _memo(self) -> dict[str, Any]:
+        """Return memoized derived values, dropping stale ones first."""
+        generation = self._root._generation
+        if self._memo_generation != generation:
+            self._memo_values = {}
+            self._memo_generation = generation
+        return self._memo_values
+
+    def invalidate(self) -> None:
+        """Discard memoized values derived from the participants.
+
+        Counts, summary(), available_pages() and the condition and page
+        indexes are computed once and cached. Call this after modifying the
+        underlying participants (or their raw data) in place; it also
+        invalidates every view of the same root dataset and refreshes the
+        fields each participant reads from its raw data (see
+        Participant.refresh). The participant table of a columnar dataset is
+        source data and is not rebuilt.
+        """
+        root = self._root
+        root._generation += 1
+        if not isinstance(root._participants, LazyParticipants):
+            for p in root._participants:
+                p.refresh()
+
+    def _scan(self) -> dict[str, Any]:
+        """Compute the memoized counts and page index in a single pass."""
+        complete = withdrawn = 0
+        page_index: dict[str, list[int]] = {}
+        for i, p in enumerate(self._participants):
+            if p.is_complete:
+                complete += 1
+            if p.withdrawn:
+                withdrawn += 1
+            for page_name in p.page_names:
+                positions = page_index.get(page_name)
+                if positions is None:
+                    positions = page_index[page_name] = []
+                positions.append(i)
+        memo = self._memo()
+        memo.update(
+            complete=complete,
+            withdrawn=withdrawn,
+            pages=sorted(page_index),
+            page_index=page_index,
+        )
+        return memo
+
+    def _page_participants(self, pages: Sequence[str]) -> Sequence[Participant]:
+        """Return the participants with data for any of some pages.
+
+        Uses the page index, which is built on first use. A lazily decoded
+        dataset is returned whole until the index exists, since building it
+        would decode every participant anyway.
+
+        Args:
+            pages: Page names (without 'pageData_' prefix).
+
+        Returns:
+            The matching participants, in dataset order.
+        """
+        memo = self._memo()
+        if "page_index" not in memo:
+            if isinstance(self._root._participants, LazyParticipants):
+                return self._participants
+            memo = self._scan()
+        page_index = memo["page_index"]
+        if len(pages) == 1:
+            positions = page_index.get(pages[0], [])
+        else:
+            positions = sorted({i for page_name in pages for i in page_index.get(page_name, ())})
+        participants = self._participants
+        return [participants[i] for i in positions]
+
+    def _counts(self) -> dict[str, Any]:
+        """Return the memo, with complete and withdrawn counts filled in."""
+        memo = self._memo()
+        if "complete" not in memo:
+            complete = self._frame_sum("is_complete")
+            withdrawn = self._frame_sum("withdrawn")
+            if complete is None or withdrawn is None:
+                return self._scan()
+            memo.update(complete=complete, withdrawn=withdrawn)
+        return memo
+
+    @property
+    def _frame(self) -> pl.DataFrame | None:
+        """The participant table, if the dataset is columnar-backed."""
+        if self._frame_data is None and self._indices is not None:
+            root_frame = self._root._frame_data
+            if root_frame is not None:
+                self._frame_data = root_frame[self._indices] if root_frame.width else root_frame
+        return self._frame_data
 
     def __len__(self) -> int:
         """Return the number of participants."""
@@ -49,9 +377,173 @@ class SmileDataset:
             Single Participant for integer index, or new SmileDataset for slice.
         """
         if isinstance(idx, slice):
-            return SmileDataset(self._participants[idx])
+            return self._take(pl.Series(range(len(self))[idx], dtype=pl.Int64))
         return self._participants[idx]
 
+    @property
+    def is_columnar(self) -> bool:
+        """Whether participant-level fields are held in a Polars DataFrame."""
+        return self._frame_data is not None or self._root._frame_data is not None
+
+    @property
+    def is_view(self) -> bool:
+        """Whether this dataset is a view of positions in another dataset."""
+        return self._indices is not None
+
+    def materialize(self) -> SmileDataset:
+        """Copy a view into a standalone dataset.
+
+        Lazily decoded participants stay lazy; their encoded records are
+        shared rather than decoded.
+
+        Returns:
+            A dataset that is not a view, or this dataset if it is not one.
+        """
+        if self._indices is None:
+            return self
+        root_participants = self._root._participants
+        if isinstance(root_participants, LazyParticipants):
+            participants: Sequence[Participant] = root_participants.take(
+                self._indices.to_list()
+            )
+        else:
+            participants = list(self._participants)
+        dataset = SmileDataset(participants, frame=self._frame)
+        dataset._coerced = self._coerced_keys()
+        return dataset
+
+    def to_columnar(self) -> SmileDataset:
+        """Return a columnar-backed dataset with the same participants.
+
+        Builds the participant-level table once, in a single pass, so later
+        counts, built-in filters and to_participants_df() are vectorized.
+
+        Returns:
+            Columnar-backed SmileDataset sharing this dataset's participants.
+        """
+        if self.is_columnar:
+            return self
+        frame, coerced = self._participants_table()
+        if self._indices is None:
+            dataset = SmileDataset(self._participants, frame=frame)
+        else:
+            dataset = SmileDataset._view(self._root, self._indices, frame=frame)
+        dataset._coerced = coerced
+        return dataset
+
+    def _take(
+        self,
+        positions: Sequence[int] | pl.Series,
+        frame: pl.DataFrame | None = None,
+        coerced: frozenset[str] | None = None,
+    ) -> SmileDataset:
+        """Return a view of the participants at the given positions.
+
+        Args:
+            positions: Positions of the participants to keep, in order.
+            frame: Participant table of this dataset for the view to carry,
+                if the root has none (e.g. one built for a single query).
+            coerced: Condition keys coerced to strings in ``frame``.
+
+        Returns:
+            View of this dataset's root; columnar-backed if this one is, or
+            if a table is given.
+        """
+        positions = pl.Series(positions, dtype=pl.Int64)
+        if self._indices is None:
+            indices = positions
+        else:
+            indices = self._indices.gather(positions)
+        if frame is None and self._frame_data is not None and self._root._frame_data is None:
+            # A table built for this view only: carry it over
+            frame, coerced = self._frame_data, self._coerced
+        if frame is not None and frame.width:
+            frame = frame[positions]
+        view = SmileDataset._view(self._root, indices, frame=frame)
+        view._coerced = coerced
+        return view
+
+    def _take_root(self, root_positions: list[int]) -> SmileDataset:
+        """Return a view of the participants at some positions of the root.
+
+        Args:
+            root_positions: Sorted positions in the root dataset, e.g. from
+                its condition index. Positions outside this view are ignored.
+
+        Returns:
+            View with the matching participants, in this dataset's order.
+        """
+        if self._indices is None:
+            return self._take(root_positions)
+        return self._take(self._indices.is_in(root_positions).arg_true())
+
+    def _where_frame(self, predicate: pl.Expr) -> SmileDataset | None:
+        """Filter a columnar-backed dataset with a Polars expression.
+
+        Args:
+            predicate: Boolean expression over the participant table.
+
+        Returns:
+            The filtered dataset, or None if the dataset is not columnar or
+            the expression cannot be evaluated on its table (e.g. a value of
+            a different type than the column).
+        """
+        if self._frame is None or not self._frame.width:
+            return None
+        try:
+            return self._take(self._where_indices(predicate))
+        except (pl.exceptions.PolarsError, TypeError):
+            return None
+
+    def _where_indices(self, predicate: pl.Expr, frame: pl.DataFrame | None = None) -> pl.Series:
+        """Return the positions of participants matching an expression.
+
+        Args:
+            predicate: Boolean expression over the participant table.
+            frame: Participant table to evaluate on. Defaults to the
+                dataset's own table.
+
+        Returns:
+            Matching positions, in order.
+        """
+        if frame is None:
+            frame = self._frame
+        assert frame is not None
+        if not frame.width:
+            return pl.Series(dtype=pl.Int64)
+        positions = pl.int_range(pl.len()).filter(predicate)
+        return frame.select(positions).to_series()
+
+    def _participant_ids(self) -> list[str]:
+        """Return the distinct participant IDs, in order (memoized)."""
+        memo = self._memo()
+        if "ids" not in memo:
+            if self._frame is not None and "id" in self._frame.columns:
+                ids = self._frame["id"].to_list()
+            else:
+                ids = [p.id for p in self._participants]
+            memo["ids"] = list(dict.fromkeys(ids))
+        return memo["ids"]
+
+    def _encode(
+        self, df: pl.DataFrame, categorical: bool | Sequence[str], id_column: str
+    ) -> pl.DataFrame:
+        """Apply a method's ``categorical`` option to a frame it built.
+
+        The participant ID Enum lists every participant of the root dataset,
+        so frames from the dataset and from any of its views share one type.
+        """
+        if categorical is False or not df.width:
+            return df
+        ids = self._root._participant_ids()
+        return encode_categoricals(df, categorical, id_columns=(id_column,), ids=ids)
+
+    def _frame_sum(self, column: str) -> int | None:
+        """Count true values of a boolean column of the participant table."""
+        if self._frame is None or column not in self._frame.columns:
+            return None
+        return int(self._frame[column].sum())
+
     @property
     def participant_count(self) -> int:
         """Total number of participants."""
@@ -60,12 +552,12 @@ class SmileDataset:
     @property
     def complete_count(self) -> int:
         """Number of complete participants."""
-        return sum(1 for p in self._participants if p.is_complete)
+        return self._counts()["complete"]
 
     @property
     def withdrawn_count(self) -> int:
         """Number of withdrawn participants."""
-        return sum(1 for p in self._participants if p.withdrawn)
+        return self._counts()["withdrawn"]
 
     def filter(self, predicate: Callable[[Participant], bool]) -> SmileDataset:
         """Filter participants by a custom predicate.
@@ -76,7 +568,38 @@ class SmileDataset:
         Returns:
             New SmileDataset with only participants matching the predicate.
         """
-        return SmileDataset([p for p in self._participants if predicate(p)])
+        return self._take([i for i, p in enumerate(self._participants) if predicate(p)])
+
+    def where(self, *predicates: pl.Expr) -> SmileDataset:
+        """Filter participants with Polars expressions.
+
+        The expressions are evaluated in one vectorized pass over the
+        participant-level table (see to_participants_df()). If the dataset is
+        not columnar-backed, a table is built for this call and kept only by
+        the result; use to_columnar() first to reuse it across calls.
+
+        Args:
+            *predicates: Boolean expressions over the participant table's
+                columns, e.g. ``pl.col("condition_condition") == "A"``.
+                Several expressions are combined with 'and'.
+
+        Returns:
+            New columnar-backed SmileDataset with only the participants for
+            which every expression is true.
+
+        Raises:
+            ValueError: If no expression is given.
+            polars.exceptions.PolarsError: If an expression cannot be
+                evaluated, e.g. because it refers to a missing column.
+        """
+        if not predicates:
+            raise ValueError("where() requires at least one expression")
+        predicate = pl.all_horizontal(predicates)
+        if self.is_columnar:
+            return self._take(self._where_indices(predicate))
+        # Leave this dataset reading its participants, so invalidate() still applies
+        frame, coerced = self._participants_table()
+        return self._take(self._where_indices(predicate, frame), frame=frame, coerced=coerced)
 
     def complete_only(self) -> SmileDataset:
         """Return only complete participants.
@@ -86,17 +609,69 @@ class SmileDataset:
         Returns:
             New SmileDataset with only complete participants.
         """
+        filtered = self._where_frame(pl.col("is_complete"))
+        if filtered is not None:
+            return filtered
         return self.filter(lambda p: p.is_complete)
 
+    def _condition_index(self, keys: Iterable[str] = ()) -> _ConditionIndex:
+        """Return the condition and recruitment index, building it on first use.
+
+        Args:
+            keys: Condition names about to be looked up. Any whose column in
+                the participant table holds mixed-type values coerced to
+                strings are re-indexed from the participants.
+
+        Returns:
+            The root dataset's index.
+        """
+        if self._indices is not None:
+            # Views share their root's index
+            return self._root._condition_index(keys)
+        memo = self._memo()
+        if "index" not in memo:
+            if self._frame is not None and self._frame.width:
+                memo["index"] = _ConditionIndex.from_frame(self._frame, self._coerced)
+            else:
+                memo["index"] = _ConditionIndex.from_participants(self._participants)
+        index: _ConditionIndex = memo["index"]
+        for key in keys:
+            if key in index.string_keys:
+                index.reindex(key, self._participants)
+        return index
+
     def by_condition(self, **conditions: Any) -> SmileDataset:
         """Filter by condition values.
 
+        The first call builds an index of participants by condition value,
+        so later calls on the same dataset only touch the matches.
+
         Args:
             **conditions: Condition name-value pairs to match.
 
         Returns:
             New SmileDataset with only participants matching all conditions.
         """
+        positions = self._condition_index(conditions).lookup(conditions)
+        if positions is not None:
+            return self._take_root(positions)
+
+        frame = self._frame
+        # String columns may hold coerced values that only the participants tell apart
+        if frame is not None and all(
+            frame.schema.get(f"condition_{k}") != pl.String for k in conditions
+        ):
+            predicate = pl.lit(True)
+            for k, v in conditions.items():
+                column = f"condition_{k}"
+                if column in frame.columns:
+                    predicate &= pl.col(column).eq_missing(v)
+                elif v is not None:
+                    # Nobody has this condition, so only None could match
+                    predicate &= pl.lit(False)
+            filtered = self._where_frame(predicate)
+            if filtered is not None:
+                return filtered
 
         def matches(p: Participant) -> bool:
             p_conditions = p.conditions
@@ -107,13 +682,57 @@ class SmileDataset:
     def by_recruitment(self, service: str) -> SmileDataset:
         """Filter by recruitment service.
 
+        Uses the same index as by_condition().
+
         Args:
             service: Recruitment service name (e.g., 'prolific').
 
         Returns:
             New SmileDataset with only participants from that service.
         """
-        return self.filter(lambda p: p.recruitment_service == service)
+        index = self._condition_index()
+        try:
+            return self._take_root(index.recruitment.get(service, []))
+        except TypeError:
+            return self.filter(lambda p: p.recruitment_service == service)
+
+    def groupby_condition(self, *keys: str) -> dict[tuple[Any, ...], SmileDataset]:
+        """Split the dataset by condition values in a single pass.
+
+        Args:
+            *keys: Condition names to group by. Defaults to every condition
+                name found in the dataset (except ones with unhashable values).
+
+        Returns:
+            Dict mapping each tuple of condition values (in the order of
+            ``keys``, with None for a missing condition) to the participants
+            with those values, in order of first appearance.
+
+        Raises:
+            TypeError: If a condition has unhashable values.
+        """
+        index = self._condition_index()
+        if not keys:
+            keys = tuple(index.conditions)
+        index = self._condition_index(keys)
+        unhashable = [key for key in keys if key in index.unhashable]
+        if unhashable:
+            raise TypeError(f"Cannot group by conditions with unhashable values: {unhashable}")
+
+        columns: list[list[Any]] = []
+        for key in keys:
+            column: list[Any] = [None] * index.size
+            for value, positions in index.conditions.get(key, {}).items():
+                for i in positions:
+                    column[i] = value
+            if self._indices is not None:
+                column = [column[i] for i in self._indices.to_list()]
+            columns.append(column)
+
+        groups: dict[tuple[Any, ...], list[int]] = {}
+        for i, group in enumerate(zip(*columns, strict=True) if columns else [()] * len(self)):
+            groups.setdefault(group, []).append(i)
+        return {group: self._take(positions) for group, positions in groups.items()}
 
     def summary(self) -> dict[str, int]:
         """Return summary statistics about the dataset.
@@ -122,8 +741,9 @@ class SmileDataset:
             Dictionary with counts for total, complete, withdrawn, incomplete.
         """
         total = len(self._participants)
-        complete = self.complete_count
-        withdrawn = self.withdrawn_count
+        counts = self._counts()
+        complete = counts["complete"]
+        withdrawn = counts["withdrawn"]
         incomplete = total - complete - withdrawn
         return {
             "total": total,
@@ -138,24 +758,55 @@ class SmileDataset:
         Returns:
             List of page names (without 'pageData_' prefix) that have data.
         """
-        pages: set[str] = set()
-        for p in self._participants:
-            for key in p.raw_data.keys():
-                if key.startswith("pageData_"):
-                    page_name = key[9:]  # Remove 'pageData_' prefix
-                    pages.add(page_name)
-        return sorted(pages)
+        memo = self._memo()
+        if "pages" not in memo:
+            memo = self._scan()
+        return list(memo["pages"])
 
-    def to_participants_df(self) -> pl.DataFrame:
+    def to_participants_df(self, categorical: bool | Sequence[str] = False) -> pl.DataFrame:
         """Create DataFrame with one row per participant (metadata).
 
+        Args:
+            categorical: Whether to encode repeated string columns as
+                pl.Categorical and participant IDs as a pl.Enum of all the
+                dataset's participant IDs, or the names of the columns to
+                encode. Frames built this way can be joined on their
+                categorical columns.
+
         Returns:
             DataFrame with participant-level metadata.
         """
+        if categorical is not False:
+            return self._encode(self.to_participants_df(), categorical, "id")
+
+        return self._participants_table()[0]
+
+    def _coerced_keys(self) -> frozenset[str] | None:
+        """Condition keys coerced to strings in the participant table, or None if unknown."""
+        if self._coerced is None and self._indices is not None:
+            # Views without a table of their own gather the root's
+            return self._root._coerced
+        return self._coerced
+
+    def _participants_table(self) -> tuple[pl.DataFrame, frozenset[str] | None]:
+        """Return the participant table and its coerced condition keys.
+
+        Polars stores a column of mixed-type values (e.g. 1 and "1") as
+        strings, so such condition values can no longer be told apart in
+        the table. Tables built here record which keys that happened to.
+
+        Returns:
+            Tuple of (table, keys), where keys are the condition names whose
+            column holds coerced values, or None if that is unknown.
+        """
+        if self._frame is not None:
+            return self._frame.clone(), self._coerced_keys()
+
         if not self._participants:
-            return pl.DataFrame()
+            return pl.DataFrame(), frozenset()
 
         rows = []
+        types: dict[str, set[type]] = {}
         for p in self._participants:
             row = {
                 "id": p.id,
@@ -171,40 +822,127 @@ class SmileDataset:
             # Add conditions as separate columns
             for k, v in p.conditions.items():
                 row[f"condition_{k}"] = v
+                if v is not None:
+                    types.setdefault(k, set()).add(type(v))
             rows.append(row)
 
-        return pl.DataFrame(rows)
+        frame = pl.DataFrame(rows)
+        coerced = frozenset(
+            k
+            for k, seen in types.items()
+            if seen != {str} and frame.schema[f"condition_{k}"] == pl.String
+        )
+        return frame, coerced
 
-    def to_trials_df(
+    def to_participants_lazy(self) -> pl.LazyFrame:
+        """Return the participant-level table as a LazyFrame.
+
+        Scans the participant table the dataset holds, so Polars can push
+        projections and filters into it. If the dataset is not columnar,
+        the table is built for this call only; use to_columnar() first to
+        reuse it across calls.
+
+        Returns:
+            LazyFrame with the to_participants_df() columns.
+        """
+        if self._frame is not None:
+            return self._frame.lazy()
+        return self.to_participants_df().lazy()
+
+    def to_trials_lazy(
         self, page: str | None = None, include_participant_id: bool = True
+    ) -> pl.LazyFrame:
+        """Return trial-level data as a LazyFrame.
+
+        For datasets read with from_parquet(), this scans the stored trial
+        table, so Polars only reads the columns and row groups a query needs.
+        Otherwise the full trial table is built by this call, as with
+        to_trials_df(), and is not kept once the query is done.
+
+        Args:
+            page: Page/route name to extract data from, or None for studyData
+                (as in to_trials_df()).
+            include_participant_id: Whether to include participant_id column.
+
+        Returns:
+            LazyFrame with trial-level data from all participants.
+
+        Raises:
+            ValueError: If page is None and studyData is empty, with helpful message.
+        """
+        store = self._root._store
+        if store is not None:
+            from .columnar import trials_path
+
+            path = trials_path(store, page)
+            if path.exists():
+                lf = pl.scan_parquet(path)
+                if self._indices is not None:
+                    lf = lf.filter(pl.col("participant_id").is_in(self._participant_ids()))
+                if not include_participant_id:
+                    lf = lf.drop("participant_id")
+                return lf
+
+        return self.to_trials_df(page, include_participant_id).lazy()
+
+    def to_trials_df(
+        self,
+        page: str | None = None,
+        include_participant_id: bool = True,
+        schema: SchemaDict | None = None,
+        schema_overrides: SchemaDict | None = None,
+        downcast: bool = False,
+        categorical: bool | Sequence[str] = False,
     ) -> pl.DataFrame:
         """Create DataFrame with one row per trial.
 
+        Column types are inferred from all values across participants,
+        unless given with ``schema`` or ``schema_overrides``.
+
         Args:
             page: Page/route name to extract data from (e.g., 'mental_rotation_exp').
                   If provided, extracts from pageData_<page>. If None, uses studyData.
             include_participant_id: Whether to include participant_id column.
+            schema: Columns to return, in order, with their Polars types, as
+                in ``pl.DataFrame(schema=...)``. Other columns are dropped.
+            schema_overrides: Polars types for some columns, e.g.
+                ``{"rt": pl.Float64}``; the rest are inferred.
+            downcast: Whether to shrink inferred types where no values are
+                lost: integers to Int32 and repetitive strings (participant
+                IDs, conditions, responses) to Categorical.
+            categorical: Whether to encode repeated string columns as
+                pl.Categorical and participant IDs as a pl.Enum of all the
+                dataset's participant IDs, or the names of the columns to
+                encode. Frames built this way can be joined on their
+                categorical columns.
 
         Returns:
             DataFrame with trial-level data from all participants.
 
         Raises:
             ValueError: If page is None and studyData is empty, with helpful message.
+            TypeError: If values do not fit a type given in the schema.
         """
         # If page is specified, delegate to to_page_data_df
         if page is not None:
-            return self.to_page_data_df(page)
+            return self.to_page_data_df(
+                page,
+                schema=schema,
+                schema_overrides=schema_overrides,
+                downcast=downcast,
+                categorical=categorical,
+            )
 
         # Otherwise, try to use studyData (legacy behavior)
-        all_rows = []
-        for p in self._participants:
-            for trial in p.study_data:
-                row = dict(trial)
-                if include_participant_id:
-                    row["participant_id"] = p.id
-                all_rows.append(row)
+        df = study_data_to_df(
+            self._participants,
+            include_participant_id,
+            schema=schema,
+            schema_overrides=schema_overrides,
+            downcast=downcast,
+        )
 
-        if not all_rows:
+        if not df.height:
             # Check if there are pageData fields available
             available = self.available_pages()
             if available:
@@ -213,13 +951,19 @@ class SmileDataset:
                     f"Available pages: {available}. "
                     "Use to_trials_df(page='<page_name>') or to_page_data_df('<page_name>') instead."
                 )
-            return pl.DataFrame()
 
-        return pl.DataFrame(all_rows)
+        return self._encode(df, categorical, "participant_id")
 
-    def demographics_df(self) -> pl.DataFrame:
+    def demographics_df(self, categorical: bool | Sequence[str] = False) -> pl.DataFrame:
         """Create DataFrame of demographic data.
 
+        Args:
+            categorical: Whether to encode repeated string columns as
+                pl.Categorical and participant IDs as a pl.Enum of all the
+                dataset's participant IDs, or the names of the columns to
+                encode. Frames built this way can be joined on their
+                categorical columns.
+
         Returns:
             DataFrame with one row per participant, containing demographics.
         """
@@ -233,9 +977,67 @@ class SmileDataset:
         if not rows:
             return pl.DataFrame()
 
-        return pl.DataFrame(rows)
+        return self._encode(pl.DataFrame(rows), categorical, "participant_id")
+
+    def forms_df(
+        self,
+        form_names: Sequence[str],
+        which: str = "last",
+        layout: str = "long",
+        schema_overrides: SchemaDict | None = None,
+        downcast: bool = False,
+        categorical: bool | Sequence[str] = False,
+    ) -> pl.DataFrame:
+        """Create one DataFrame of form submissions across all participants.
+
+        Collects what get_form() returns for each participant and form in a
+        single pass, reading the demograph, device and feedback forms from
+        their legacy fields where present (see forms_to_df()). In the long
+        layout, participants without any of the forms are skipped using the
+        page index, unless a form with a legacy field is requested.
+
+        Args:
+            form_names: Form/page names (e.g. 'demograph', 'device', 'feedback').
+            which: 'last' for each participant's most recent submission of
+                each form, or 'all' for every submission of every visit.
+            layout: 'long' for one row per submission, with participant_id,
+                form, visit, index and timestamp columns, or 'wide' for one
+                row per participant with '<form>_<field>' columns (requires
+                which='last').
+            schema_overrides: Polars types for some columns; the rest are
+                inferred from all values.
+            downcast: Whether to shrink inferred types (see to_trials_df()).
+            categorical: Columns to encode as categories (see to_trials_df()).
 
-    def to_page_data_df(self, page_name: str) -> pl.DataFrame:
+        Returns:
+            DataFrame of form submissions.
+
+        Raises:
+            ValueError: If which or layout is not a known value, or the wide
+                layout is requested with which='all'.
+        """
+        participants = self._participants
+        # The page index does not cover legacy form fields
+        if layout != "wide" and not any(name in LEGACY_FORM_FIELDS for name in form_names):
+            participants = self._page_participants(form_names)
+        df = forms_to_df(
+            participants,
+            form_names,
+            which=which,
+            layout=layout,
+            schema_overrides=schema_overrides,
+            downcast=downcast,
+        )
+        return self._encode(df, categorical, "participant_id")
+
+    def to_page_data_df(
+        self,
+        page_name: str,
+        schema: SchemaDict | None = None,
+        schema_overrides: SchemaDict | None = None,
+        downcast: bool = False,
+        categorical: bool | Sequence[str] = False,
+    ) -> pl.DataFrame:
         """Create DataFrame from specific page data across all participants.
 
         Extracts data from pageData_<page_name> fields and flattens
@@ -243,41 +1045,93 @@ class SmileDataset:
 
         Args:
             page_name: The page/route name (without 'pageData_' prefix).
+            schema: Columns to return, in order, with their Polars types.
+            schema_overrides: Polars types for some columns; the rest are
+                inferred from all values across participants.
+            downcast: Whether to shrink inferred types (see to_trials_df()).
+            categorical: Columns to encode as categories (see to_trials_df()).
 
         Returns:
             DataFrame with page data from all participants.
         """
-        all_rows = []
-        for p in self._participants:
-            page_data = p.get_page_data(page_name)
-            if not page_data:
-                continue
+        df = page_data_to_df(
+            self._page_participants([page_name]),
+            page_name,
+            schema=schema,
+            schema_overrides=schema_overrides,
+            downcast=downcast,
+        )
+        return self._encode(df, categorical, "participant_id")
 
-            # Handle visit-based structure (visit_0, visit_1, etc.)
-            for visit_key, visit_data in page_data.items():
-                if not visit_key.startswith("visit_"):
-                    continue
-
-                visit_num = int(visit_key.split("_")[1])
-                data_list = visit_data.get("data", [])
-                timestamps = visit_data.get("timestamps", [])
-
-                for i, data in enumerate(data_list):
-                    row = {
-                        "participant_id": p.id,
-                        "visit": visit_num,
-                        "index": i,
-                    }
-                    if i < len(timestamps):
-                        row["timestamp"] = timestamps[i]
-                    row.update(data)
-                    all_rows.append(row)
-
-        if not all_rows:
-            return pl.DataFrame()
+    def to_page_data_dfs(
+        self,
+        pages: Sequence[str] | None = None,
+        schema_overrides: SchemaDict | None = None,
+        downcast: bool = False,
+    ) -> dict[str, pl.DataFrame]:
+        """Create DataFrames for several pages in a single pass over the participants.
+
+        Equivalent to calling to_page_data_df() for each page, but walks the
+        participants only once.
+
+        Args:
+            pages: Page/route names (without 'pageData_' prefix). Defaults to
+                every page found in the dataset, as in available_pages().
+            schema_overrides: Polars types for columns of any page that has them.
+            downcast: Whether to shrink inferred types (see to_trials_df()).
+
+        Returns:
+            Dict mapping each page name to its DataFrame (empty if the page
+            has no data), in the order given, or sorted if ``pages`` is None.
+        """
+        participants = self._participants if pages is None else self._page_participants(pages)
+        return page_data_to_dfs(
+            participants, pages, schema_overrides=schema_overrides, downcast=downcast
+        )
+
+    def to_parquet(self, directory: str | Path) -> None:
+        """Write the dataset to a directory of Parquet tables.
+
+        Writes participants (with each raw record, so participants can be
+        rebuilt), demographics, studyData trials and one table per page, each
+        as a separate Parquet file. Existing tables in the directory are
+        replaced.
+
+        Args:
+            directory: Output directory (created if needed).
+        """
+        from .columnar import write_parquet
 
-        return pl.DataFrame(all_rows)
+        write_parquet(self, directory)
+
+    @classmethod
+    def from_parquet(cls, directory: str | Path) -> SmileDataset:
+        """Load a dataset written by to_parquet().
+
+        Only the participant table is read, as a columnar scan; participants
+        are rebuilt from their stored raw records when accessed.
+
+        Args:
+            directory: Directory written by to_parquet().
+
+        Returns:
+            SmileDataset with the stored participants.
+
+        Raises:
+            FileNotFoundError: If the directory has no participants table.
+        """
+        from .columnar import read_parquet
+
+        return read_parquet(directory)
 
     def __repr__(self) -> str:
-        """String representation of the dataset."""
+        """String representation of the dataset.
+
+        The complete count is left out for a lazily decoded dataset that has
+        not counted it yet, since counting would decode every participant.
+        """
+        lazy = isinstance(self._root._participants, LazyParticipants)
+        if lazy and not self.is_columnar and "complete" not in self._memo():
+            return f"SmileDataset(n={len(self)})"
         return f"SmileDataset(n={len(self)}, complete={self.complete_count})"
+
@@ -0,0 +1,143 @@
+"""Lazily decoded participant sequences."""
+
+from __future__ import annotations
+
+import mmap
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import overload
+
+from .backends import Decoder, get_decoder
+from .participant import Participant
+
+# Number of decoded participants kept per LazyParticipants family
+DEFAULT_CACHE_SIZE = 4096
+
+
+class OffsetRecords(Sequence[bytes]):
+    """Encoded participant records located by byte offsets in an export file.
+
+    The file is memory-mapped read-only, and each record is sliced out of the
+    map when requested. The file must not be modified while in use.
+    """
+
+    def __init__(self, path: str | Path, starts: Sequence[int], ends: Sequence[int]) -> None:
+        """Initialize from the byte range of each record.
+
+        Args:
+            path: Path to the export file.
+            starts: Byte offset where each record starts.
+            ends: Byte offset just past the end of each record.
+        """
+        self.path = Path(path)
+        self._starts = starts
+        self._ends = ends
+        self._mapped: mmap.mmap | None = None
+        if len(starts):
+            with open(self.path, "rb") as f:
+                # The map keeps its own handle, so the file can be closed
+                self._mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self._starts)
+
+    def __getitem__(self, idx: int) -> bytes:  # type: ignore[override]
+        """Return the encoded record at an index."""
+        return self._mapped[self._starts[idx] : self._ends[idx]]  # type: ignore[index]
+
+
+class LazyParticipants(Sequence[Participant]):
+    """A read-only sequence of participants decoded on first access.
+
+    Holds one encoded JSON record per participant and only decodes a record
+    when that participant is accessed. Recently used participants are kept in
+    a bounded LRU cache, so memory is bounded by the working set rather than
+    the size of the export.
+
+    Slicing returns another LazyParticipants that shares the encoded records
+    and the decode cache with its parent.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[bytes | str],
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        decode: Decoder | None = None,
+    ) -> None:
+        """Initialize from a sequence of encoded participant records.
+
+        Args:
+            records: Sequence of JSON-encoded participant objects (e.g. a list
+                of bytes, a Polars Binary Series or OffsetRecords).
+            cache_size: Maximum number of decoded participants to keep.
+            decode: JSON decode function. Defaults to the fastest installed
+                backend (see smiledata.backends).
+        """
+        self._records = records
+        self._load = decode or get_decoder()
+        self._positions: Sequence[int] = range(len(records))
+        self._cache: OrderedDict[int, Participant] = OrderedDict()
+        self._cache_size = cache_size
+
+    def _subset(self, positions: Sequence[int]) -> LazyParticipants:
+        """Create a sequence over some of this sequence's records."""
+        subset = object.__new__(LazyParticipants)
+        subset._records = self._records
+        subset._load = self._load
+        subset._positions = positions
+        subset._cache = self._cache
+        subset._cache_size = self._cache_size
+        return subset
+
+    def _decode(self, position: int) -> Participant:
+        """Return the participant at a record position, decoding if needed."""
+        cache = self._cache
+        participant = cache.get(position)
+        if participant is not None:
+            cache.move_to_end(position)
+            return participant
+
+        participant = Participant(self._load(self._records[position]))
+        cache[position] = participant
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return participant
+
+    def take(self, indices: Sequence[int]) -> LazyParticipants:
+        """Return a lazy subsequence of the participants at some positions.
+
+        Args:
+            indices: Positions within this sequence, in the desired order.
+
+        Returns:
+            LazyParticipants sharing the encoded records and decode cache.
+        """
+        positions = self._positions
+        return self._subset([positions[i] for i in indices])
+
+    def __len__(self) -> int:
+        """Return the number of participants."""
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[Participant]:
+        """Iterate over participants, decoding each on demand."""
+        for position in self._positions:
+            yield self._decode(position)
+
+    @overload
+    def __getitem__(self, idx: int) -> Participant: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> LazyParticipants: ...
+
+    def __getitem__(self, idx: int | slice) -> Participant | LazyParticipants:
+        """Get a participant by index, or a lazy subsequence by slice."""
+        if isinstance(idx, slice):
+            return self._subset(self._positions[idx])
+        return self._decode(self._positions[idx])
+
+    def __repr__(self) -> str:
+        """String representation of the sequence."""
+        return f"LazyParticipants(n={len(self)}, cached={len(self._cache)})"
@@ -2,18 +2,48 @@
 
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import Any
 
 import polars as pl
 
+# Top-level fields that older exports stored a form's single submission in
+LEGACY_FORM_FIELDS = {
+    "demograph": "demographicForm",
+    "device": "deviceForm",
+    "feedback": "feedbackForm",
+}
+
 
 class Participant:
     """Represents a single participant's data from a Smile experiment.
 
     Wraps the raw dictionary data from a JSON export and provides
     convenient property accessors and methods for common operations.
+
+    The most frequently used fields (id, seed_id, consented, withdrawn,
+    done, is_complete, recruitment_service, timezone and conditions) are
+    read from the raw data once, at construction. The participant's page
+    names and the visits of each pageData_* field are indexed on first
+    access. Call refresh() after modifying raw_data in place.
     """
 
+    __slots__ = (
+        "_conditions",
+        "_consented",
+        "_data",
+        "_done",
+        "_id",
+        "_is_complete",
+        "_last_visits",
+        "_page_names",
+        "_recruitment_service",
+        "_seed_id",
+        "_timezone",
+        "_visits",
+        "_withdrawn",
+    )
+
     def __init__(self, data: dict[str, Any]) -> None:
         """Initialize a Participant with raw data.
 
@@ -21,16 +51,33 @@ class Participant:
             data: Dictionary containing participant data from JSON export.
         """
         self._data = data
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-read the pre-extracted fields and drop the page indexes."""
+        get = self._data.get
+        self._id: str = get("id", "")
+        self._seed_id: str = get("seedID", "")
+        self._consented: bool = get("consented", False)
+        self._withdrawn: bool = get("withdrawn", False)
+        self._done: bool = get("done", False)
+        self._is_complete: bool = self._consented and self._done and not self._withdrawn
+        self._recruitment_service: str = get("recruitmentService", "")
+        self._timezone: str = get("userTimezone", "")
+        self._conditions: dict[str, Any] = get("conditions", {})
+        self._page_names: tuple[str, ...] | None = None
+        self._visits: dict[str, dict[int, dict[str, Any]]] = {}
+        self._last_visits: dict[str, dict[str, Any] | None] = {}
 
     @property
     def id(self) -> str:
         """Firebase document ID."""
-        return self._data.get("id", "")
+        return self._id
 
     @property
     def seed_id(self) -> str:
         """UUID used for random seeding."""
-        return self._data.get("seedID", "")
+        return self._seed_id
 
     @property
     def firebase_auth_id(self) -> str:
@@ -40,17 +87,17 @@ class Participant:
     @property
     def consented(self) -> bool:
         """Whether the participant consented to the study."""
-        return self._data.get("consented", False)
+        return self._consented
 
     @property
     def withdrawn(self) -> bool:
         """Whether the participant withdrew from the study."""
-        return self._data.get("withdrawn", False)
+        return self._withdrawn
 
     @property
     def done(self) -> bool:
         """Whether the participant completed the experiment."""
-        return self._data.get("done", False)
+        return self._done
 
     @property
     def is_complete(self) -> bool:
@@ -59,12 +106,12 @@ class Participant:
         A participant is complete if they consented, finished (done),
         and did not withdraw.
         """
-        return self.consented and self.done and not self.withdrawn
+        return self._is_complete
 
     @property
     def recruitment_service(self) -> str:
         """Recruitment service used (e.g., 'prolific', 'mturk')."""
-        return self._data.get("recruitmentService", "")
+        return self._recruitment_service
 
     @property
     def demographics(self) -> dict[str, Any] | None:
@@ -73,12 +120,7 @@ class Participant:
         Checks both legacy 'demographicForm' field and new 'pageData_demograph'.
         Returns the most recent submission.
         """
-        # Try legacy field first
-        legacy = self._data.get("demographicForm")
-        if legacy:
-            return legacy
-        # Fall back to pageData_demograph
-        return self._get_last_page_data_entry("demograph")
+        return self.get_legacy_form("demograph") or self._get_last_page_data_entry("demograph")
 
     @property
     def device_info(self) -> dict[str, Any] | None:
@@ -87,12 +129,7 @@ class Participant:
         Checks both legacy 'deviceForm' field and new 'pageData_device'.
         Returns the most recent submission.
         """
-        # Try legacy field first
-        legacy = self._data.get("deviceForm")
-        if legacy:
-            return legacy
-        # Fall back to pageData_device
-        return self._get_last_page_data_entry("device")
+        return self.get_legacy_form("device") or self._get_last_page_data_entry("device")
 
     @property
     def feedback(self) -> dict[str, Any] | None:
@@ -101,12 +138,7 @@ class Participant:
         Checks both legacy 'feedbackForm' field and new 'pageData_feedback'.
         Returns the most recent submission.
         """
-        # Try legacy field first
-        legacy = self._data.get("feedbackForm")
-        if legacy:
-            return legacy
-        # Fall back to pageData_feedback
-        return self._get_last_page_data_entry("feedback")
+        return self.get_legacy_form("feedback") or self._get_last_page_data_entry("feedback")
 
     @property
     def quiz(self) -> dict[str, Any] | None:
@@ -156,6 +188,24 @@ class Participant:
 
         return self._get_last_page_data_entry(form_name)
 
+    def get_legacy_form(self, form_name: str) -> dict[str, Any] | None:
+        """Get a form's submission from its legacy top-level field.
+
+        Older exports stored the demograph, device and feedback forms in
+        'demographicForm', 'deviceForm' and 'feedbackForm'. The
+        demographics, device_info and feedback properties prefer these
+        fields over pageData_<form>.
+
+        Args:
+            form_name: Form name (e.g., 'demograph').
+
+        Returns:
+            The legacy submission, or None if the form has no legacy field
+            or it is empty.
+        """
+        field = LEGACY_FORM_FIELDS.get(form_name)
+        return (self._data.get(field) or None) if field else None
+
     def _get_visit_entry(
         self, page_name: str, visit: int
     ) -> dict[str, Any] | None:
@@ -168,18 +218,38 @@ class Participant:
         Returns:
             The last data entry from that visit, or None if not found.
         """
-        page_data = self.get_page_data(page_name)
-        if not page_data:
-            return None
-
-        visit_key = f"visit_{visit}"
-        visit_data = page_data.get(visit_key)
+        visit_data = self.page_visits(page_name).get(visit)
         if not visit_data:
             return None
 
         data_list = visit_data.get("data", [])
         return data_list[-1] if data_list else None
 
+    def page_visits(self, page_name: str) -> dict[int, dict[str, Any]]:
+        """Get the visits of a page, indexed on first access.
+
+        The index is cached until refresh(), so treat it as read-only.
+
+        Args:
+            page_name: The page name (without 'pageData_' prefix).
+
+        Returns:
+            Dictionary mapping each visit number to that visit's record
+            (holding its 'data' and 'timestamps'), in ascending visit order.
+        """
+        visits = self._visits.get(page_name)
+        if visits is None:
+            page_data = self.get_page_data(page_name) or {}
+            numbered = [
+                (int(key.split("_")[1]), visit_data)
+                for key, visit_data in page_data.items()
+                if key.startswith("visit_")
+            ]
+            numbered.sort(key=itemgetter(0))
+            visits = {number: visit_data or {} for number, visit_data in numbered}
+            self._visits[page_name] = visits
+        return visits
+
     def _get_last_page_data_entry(self, page_name: str) -> dict[str, Any] | None:
         """Get the last data entry from a page (most recent submission).
 
@@ -191,18 +261,20 @@ class Participant:
         Returns:
             The last data entry dict, or None if not found.
         """
-        page_data = self.get_page_data(page_name)
-        if not page_data:
-            return None
-
-        # Find all visit keys and get the highest numbered one
-        visit_keys = [k for k in page_data.keys() if k.startswith("visit_")]
-        if not visit_keys:
-            return None
-
-        # Sort by visit number and get the last one
-        visit_keys.sort(key=lambda k: int(k.split("_")[1]))
-        last_visit = page_data.get(visit_keys[-1])
+        last_visits = self._last_visits
+        if page_name in last_visits:
+            last_visit = last_visits[page_name]
+        else:
+            # Only the highest visit is needed, so skip building the sorted index
+            page_data = self.get_page_data(page_name) or {}
+            last_number = -1
+            last_visit = None
+            for key, visit_data in page_data.items():
+                if key.startswith("visit_"):
+                    number = int(key.split("_")[1])
+                    if number > last_number:
+                        last_number, last_visit = number, visit_data
+            last_visits[page_name] = last_visit
         if not last_visit:
             return None
 
@@ -221,19 +293,8 @@ class Participant:
         Returns:
             List of all data entries, ordered by visit then index.
         """
-        page_data = self.get_page_data(page_name)
-        if not page_data:
-            return []
-
         entries = []
-        visit_keys = sorted(
-            [k for k in page_data.keys() if k.startswith("visit_")],
-            key=lambda k: int(k.split("_")[1]),
-        )
-
-        for visit_key in visit_keys:
-            visit_num = int(visit_key.split("_")[1])
-            visit_data = page_data.get(visit_key, {})
+        for visit_num, visit_data in self.page_visits(page_name).items():
             data_list = visit_data.get("data", [])
             timestamps = visit_data.get("timestamps", [])
 
@@ -251,7 +312,7 @@ class Participant:
     @property
     def conditions(self) -> dict[str, Any]:
         """Experimental conditions assigned to this participant."""
-        return self._data.get("conditions", {})
+        return self._conditions
 
     @property
     def config(self) -> dict[str, Any]:
@@ -329,7 +390,7 @@ class Participant:
     @property
     def timezone(self) -> str:
         """User's timezone (e.g., 'America/New_York')."""
-        return self._data.get("userTimezone", "")
+        return self._timezone
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get an arbitrary field from the raw data.
@@ -355,13 +416,23 @@ class Participant:
         key = f"pageData_{page_name}"
         return self._data.get(key)
 
+    @property
+    def page_names(self) -> tuple[str, ...]:
+        """Names of the pages with pageData_* fields, in export order."""
+        if self._page_names is None:
+            self._page_names = tuple(
+                key[9:] for key in self._data if key.startswith("pageData_")
+            )
+        return self._page_names
+
     def get_all_page_data(self) -> dict[str, Any]:
         """Get all pageData_* fields.
 
         Returns:
             Dictionary with all pageData_* fields, using original keys.
         """
-        return {k: v for k, v in self._data.items() if k.startswith("pageData_")}
+        keys = [f"pageData_{name}" for name in self.page_names]
+        return {key: self._data[key] for key in keys}
 
     def study_data_to_polars(self) -> pl.DataFrame:
         """Convert study_data to a Polars DataFrame.
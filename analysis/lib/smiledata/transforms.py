@@ -2,62 +2,432 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping, Sequence
+from operator import itemgetter
 from typing import Any
 
 import polars as pl
 
 from .participant import Participant
 
+# Column name to Polars data type, as in pl.DataFrame(schema=...)
+SchemaDict = Mapping[str, pl.DataType | type[pl.DataType]]
+
+# String columns with at most this ratio of distinct values become Categorical
+CATEGORICAL_MAX_RATIO = 0.5
+
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+
+
+class ColumnBuffers:
+    """Accumulates table rows as one Python list per column.
+
+    Building a DataFrame from a list of row dicts makes Polars infer the
+    schema row by row, and needs a dict per row. Appending to per-column
+    lists instead avoids the intermediate rows, and each column's type is
+    inferred from all of its values at once, so late rows with new keys or
+    wider types are kept rather than rejected. Mixed scalar types become
+    strings; a column mixing dicts, lists and scalars is kept as pl.Object.
+
+    Example:
+        >>> buffers = ColumnBuffers()
+        >>> buffers.extend([{"a": 1, "b": 2}, {"a": 3}])
+        >>> buffers.append({"c": 4})
+        >>> buffers.to_frame().to_dict(as_series=False)
+        {'a': [1, 3, None], 'b': [2, None, None], 'c': [None, None, 4]}
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty buffers."""
+        # Columns missing from the latest rows are padded with None lazily,
+        # when next written to or when the frame is built
+        self._columns: dict[str, list[Any]] = {}
+        self._length = 0
+
+    def __len__(self) -> int:
+        """Return the number of rows appended."""
+        return self._length
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Append one row.
+
+        Args:
+            record: Dict mapping column names to values.
+        """
+        self.extend([record])
+
+    def extend(
+        self,
+        records: Sequence[dict[str, Any]],
+        fields: dict[str, Sequence[Any]] | None = None,
+        overrides: dict[str, Sequence[Any]] | None = None,
+    ) -> None:
+        """Append one row per record.
+
+        Columns appear in order of first appearance, and rows without a
+        column get None. Work is done column by column, which is fastest
+        when the records share their keys (e.g. the trials of one visit).
+
+        Args:
+            records: Dicts mapping column names to values.
+            fields: Extra columns for these rows, mapping column names to
+                one value per record. They come before the records' own
+                columns, and a record's value for the same key takes
+                precedence, as with ``dict.update``.
+            overrides: Extra columns that take precedence over the records'
+                values for the same key, and otherwise come after the
+                records' own columns.
+        """
+        m = len(records)
+        if not m:
+            return
+        columns = self._columns
+        n = self._length
+
+        batch: dict[str, Iterable[Any]] = {}
+        record_columns: dict[str, list[Any]] | None = None
+        if m == 1:
+            record_columns = {key: [value] for key, value in records[0].items()}
+        elif len(set(map(len, records))) == 1:
+            # Same number of keys everywhere: the keys match unless one is missing
+            try:
+                record_columns = {key: list(map(itemgetter(key), records)) for key in records[0]}
+            except KeyError:
+                pass
+        if record_columns is None:
+            keys = dict.fromkeys(k for r in records for k in r)
+            record_columns = {key: [r.get(key) for r in records] for key in keys}
+
+        for key, values in (fields or {}).items():
+            if key in record_columns:
+                values = [r.get(key, v) for r, v in zip(records, values, strict=True)]
+                del record_columns[key]
+            batch[key] = values
+        batch.update(record_columns)
+        batch.update(overrides or {})
+
+        for key, values in batch.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * n
+            elif len(column) != n:
+                column.extend([None] * (n - len(column)))
+            column.extend(values)
+        self._length = n + m
+
+    def to_frame(
+        self,
+        schema: SchemaDict | None = None,
+        schema_overrides: SchemaDict | None = None,
+    ) -> pl.DataFrame:
+        """Build a DataFrame from the buffered columns.
+
+        Columns with a known type are built with it directly instead of
+        inferring one from their values.
+
+        Args:
+            schema: Columns to return, in order, with their types. Other
+                columns are dropped, and missing ones are filled with nulls.
+            schema_overrides: Types for some columns; the rest are inferred.
+
+        Returns:
+            DataFrame with one column per buffer (or per schema entry), or an
+            empty DataFrame if no rows were appended.
+
+        Raises:
+            TypeError: If a column's values do not fit its given type.
+        """
+        overrides = dict(schema_overrides or {})
+        if schema is not None:
+            overrides.update(schema)
+            names: Iterable[str] = schema
+        else:
+            names = self._columns
+        if not self._length:
+            return pl.DataFrame(schema=dict(schema)) if schema is not None else pl.DataFrame()
+
+        n = self._length
+        series = []
+        for name in names:
+            values = self._columns.get(name)
+            if values is None:
+                values = [None] * n
+            elif len(values) != n:
+                values.extend([None] * (n - len(values)))
+            dtype = overrides.get(name)
+            if dtype is None:
+                series.append(_to_series(name, values))
+            else:
+                series.append(pl.Series(name, values, dtype=dtype))
+        return pl.DataFrame(series)
+
+
+def _to_series(name: str, values: list[Any]) -> pl.Series:
+    """Build a Series, inferring its type from all values like pl.DataFrame does."""
+    first = next((value for value in values if value is not None), None)
+    if isinstance(first, dict | list):
+        kind = dict if isinstance(first, dict) else list
+        if all(value is None or isinstance(value, kind) for value in values):
+            # pl.Series infers nested types from the first value only
+            try:
+                return pl.from_dicts(
+                    [{name: value} for value in values], infer_schema_length=None
+                ).to_series()
+            except (TypeError, pl.exceptions.PolarsError):
+                pass
+        # Dicts mixed with lists or scalars have no common type; keep them as they are
+        return pl.Series(name, values, dtype=pl.Object)
+    try:
+        return pl.Series(name, values)
+    except (TypeError, OverflowError, pl.exceptions.PolarsError):
+        if any(isinstance(value, dict | list) for value in values):
+            return pl.Series(name, values, dtype=pl.Object)
+        # Mixed scalar types, e.g. ints and strings become strings
+        return pl.Series(name, values, strict=False)
+
 
 def flatten_nested(data: dict[str, Any], prefix: str = "") -> dict[str, Any]:
     """Flatten nested dictionaries for DataFrame conversion.
 
+    Nested dicts are walked with an explicit stack rather than recursion, and
+    keys at the top level are reused as they are. To keep nesting in a
+    DataFrame and only pull out some fields, see unnest_paths().
+
     Args:
         data: Dictionary to flatten.
-        prefix: Prefix to add to keys (used for recursion).
+        prefix: Prefix to add to keys.
 
     Returns:
-        Flattened dictionary with dot-separated keys.
+        Flattened dictionary with dot-separated keys, in depth-first order.
 
     Example:
         >>> flatten_nested({"a": {"b": 1}})
-        {"a.b": 1}
+        {'a.b': 1}
     """
     result: dict[str, Any] = {}
-    for key, value in data.items():
-        new_key = f"{prefix}.{key}" if prefix else key
-        if isinstance(value, dict):
-            result.update(flatten_nested(value, new_key))
+    stack = [(prefix, iter(data.items()))]
+    while stack:
+        path, items = stack[-1]
+        for key, value in items:
+            if path:
+                key = f"{path}.{key}"
+            if isinstance(value, dict):
+                # Descend now and resume this level once the child is done
+                stack.append((key, iter(value.items())))
+                break
+            result[key] = value
         else:
-            result[new_key] = value
+            stack.pop()
     return result
 
 
+def unnest_paths(df: pl.DataFrame, paths: Iterable[str], separator: str = ".") -> pl.DataFrame:
+    """Pull fields out of Struct columns into top-level columns.
+
+    Frames built from nested data (e.g. by to_page_data_df()) keep nested
+    dicts as Struct columns. This extracts only the requested fields, with
+    Polars expressions instead of flattening each row in Python.
+
+    Args:
+        df: DataFrame with Struct columns.
+        paths: Field paths such as 'persist.attempts'. The leading part
+            names a column (the longest matching column name is used), and
+            the rest names fields within it. A path to a struct is expanded
+            to all of the struct's leaf fields.
+        separator: Separator between the parts of a path.
+
+    Returns:
+        The DataFrame with one column per extracted field, named by its full
+        path (as flatten_nested() would name it) and added after the
+        existing columns. The Struct columns are kept.
+
+    Raises:
+        ValueError: If a path does not name a column or a field within one.
+
+    Example:
+        >>> df = pl.DataFrame({"persist": [{"attempts": 1, "ok": True}]})
+        >>> unnest_paths(df, ["persist.attempts"]).columns
+        ['persist', 'persist.attempts']
+    """
+    schema = df.schema
+    exprs: dict[str, pl.Expr] = {}
+    for path in paths:
+        parts = path.split(separator)
+        for i in range(len(parts), 0, -1):
+            name = separator.join(parts[:i])
+            if name in schema:
+                break
+        else:
+            raise ValueError(f"{path!r} does not start with a column name")
+
+        expr = pl.col(name)
+        dtype = schema[name]
+        for field_name in parts[i:]:
+            fields = {f.name: f.dtype for f in dtype.fields} if isinstance(dtype, pl.Struct) else {}
+            if field_name not in fields:
+                raise ValueError(f"{path!r} is not a field of the {name!r} column")
+            expr = expr.struct.field(field_name)
+            dtype = fields[field_name]
+
+        # Expand a struct into its leaves, depth first
+        stack = [(path, expr, dtype)]
+        while stack:
+            leaf_path, expr, dtype = stack.pop()
+            if isinstance(dtype, pl.Struct):
+                stack.extend(
+                    (f"{leaf_path}{separator}{f.name}", expr.struct.field(f.name), f.dtype)
+                    for f in reversed(dtype.fields)
+                )
+            else:
+                exprs[leaf_path] = expr.alias(leaf_path)
+    return df.with_columns(exprs.values())
+
+
 def study_data_to_df(
-    participants: list[Participant],
+    participants: Iterable[Participant],
     include_participant_id: bool = True,
+    schema: SchemaDict | None = None,
+    schema_overrides: SchemaDict | None = None,
+    downcast: bool = False,
 ) -> pl.DataFrame:
     """Convert study_data from multiple participants to a single DataFrame.
 
     Args:
         participants: List of Participant objects.
         include_participant_id: Whether to include participant_id column.
+        schema: Columns to return, in order, with their types (see
+            ColumnBuffers.to_frame()).
+        schema_overrides: Types for some columns; the rest are inferred from
+            all values across participants.
+        downcast: Whether to shrink inferred column types (see downcast_df()).
 
     Returns:
         DataFrame with one row per trial, all participants combined.
     """
-    all_rows = []
+    buffers = ColumnBuffers()
     for p in participants:
-        for trial in p.study_data:
-            row = dict(trial)
-            if include_participant_id:
-                row["participant_id"] = p.id
-            all_rows.append(row)
+        trials = p.study_data
+        if not trials:
+            continue
+        overrides = {"participant_id": [p.id] * len(trials)} if include_participant_id else None
+        buffers.extend(trials, overrides=overrides)
 
-    if not all_rows:
-        return pl.DataFrame()
+    return _finish_frame(buffers, schema, schema_overrides, downcast)
+
+
+def downcast_df(df: pl.DataFrame, exclude: Iterable[str] = ()) -> pl.DataFrame:
+    """Shrink column types where no values are lost.
+
+    Int64 columns whose values fit become Int32, and String columns with few
+    distinct values (at most CATEGORICAL_MAX_RATIO of the rows, e.g.
+    participant IDs, conditions or responses) become Categorical. Floats
+    are left as they are, and integers are not narrowed further, since
+    arithmetic on Int8/Int16 columns overflows too easily (e.g. ``rt * 1000``).
+
+    Args:
+        df: DataFrame to downcast.
+        exclude: Columns to leave unchanged.
+
+    Returns:
+        DataFrame with the same columns and values, using less memory.
+    """
+    exclude = set(exclude)
+    casts: dict[str, pl.DataType | type[pl.DataType]] = {}
+    for name, dtype in df.schema.items():
+        if name in exclude:
+            continue
+        column = df[name]
+        if dtype == pl.Int64:
+            low, high = column.min(), column.max()
+            if low is not None and _INT32_MIN <= low and high <= _INT32_MAX:
+                casts[name] = pl.Int32
+        elif dtype == pl.String and _is_repetitive(column):
+            casts[name] = pl.Categorical
+    if not casts:
+        return df
+    _share_categories()
+    return df.cast(casts)
+
+
+def encode_categoricals(
+    df: pl.DataFrame,
+    columns: bool | Iterable[str] = True,
+    id_columns: Iterable[str] = ("participant_id",),
+    ids: Sequence[str] | None = None,
+) -> pl.DataFrame:
+    """Encode repeated string columns as Categorical, and ID columns as Enum.
 
-    return pl.DataFrame(all_rows)
+    Categories are shared between frames (by the string cache on Polars
+    versions that need it), so categorical columns from different frames
+    can be compared, joined and concatenated.
+
+    Args:
+        df: DataFrame to encode.
+        columns: Columns to encode (names not in the frame are ignored).
+            True encodes the ID columns and every String column with at most
+            CATEGORICAL_MAX_RATIO distinct values per row; False leaves the
+            frame unchanged.
+        id_columns: Columns holding participant IDs, encoded as a pl.Enum.
+        ids: Categories of the ID Enum, e.g. every participant ID in a
+            dataset, so ID columns of all its frames share one type.
+            Defaults to the distinct IDs in the frame.
+
+    Returns:
+        DataFrame with the encoded columns.
+
+    Raises:
+        polars.exceptions.InvalidOperationError: If an ID column holds a value
+            missing from ``ids``, or a column cannot be encoded.
+    """
+    if columns is False:
+        return df
+    id_columns = [name for name in id_columns if name in df.columns]
+    if columns is True:
+        targets = [
+            name
+            for name, dtype in df.schema.items()
+            if name in id_columns or (dtype == pl.String and _is_repetitive(df[name]))
+        ]
+    else:
+        targets = [name for name in columns if name in df.columns]
+    if not targets:
+        return df
+
+    _share_categories()
+    casts: dict[str, pl.DataType | type[pl.DataType]] = {}
+    for name in targets:
+        if name in id_columns:
+            if ids is None:
+                ids = df[name].cast(pl.String).drop_nulls().unique(maintain_order=True).to_list()
+            casts[name] = pl.Enum([i for i in dict.fromkeys(ids) if i is not None])
+        else:
+            casts[name] = pl.Categorical
+    return df.cast(casts)
+
+
+def _is_repetitive(column: pl.Series) -> bool:
+    """Whether a column repeats its values enough to store them as categories."""
+    return bool(len(column)) and column.n_unique() <= CATEGORICAL_MAX_RATIO * len(column)
+
+
+def _share_categories() -> None:
+    """Make Categorical columns of separately built frames compatible."""
+    if not hasattr(pl, "Categories"):
+        # Older Polars keeps categories per column unless the string cache is on
+        pl.enable_string_cache()
+
+
+def _finish_frame(
+    buffers: ColumnBuffers,
+    schema: SchemaDict | None,
+    schema_overrides: SchemaDict | None,
+    downcast: bool,
+) -> pl.DataFrame:
+    """Build a frame from buffers, downcasting only the inferred columns."""
+    df = buffers.to_frame(schema=schema, schema_overrides=schema_overrides)
+    if downcast and schema is None:
+        df = downcast_df(df, exclude=schema_overrides or ())
+    return df
 
 
 def demographics_to_df(participants: list[Participant]) -> pl.DataFrame:
@@ -82,7 +452,13 @@ def demographics_to_df(participants: list[Participant]) -> pl.DataFrame:
     return pl.DataFrame(rows)
 
 
-def page_data_to_df(participants: list[Participant], page_name: str) -> pl.DataFrame:
+def page_data_to_df(
+    participants: Iterable[Participant],
+    page_name: str,
+    schema: SchemaDict | None = None,
+    schema_overrides: SchemaDict | None = None,
+    downcast: bool = False,
+) -> pl.DataFrame:
     """Extract specific page data into a DataFrame.
 
     Extracts data from pageData_<page_name> fields and flattens
@@ -91,40 +467,197 @@ def page_data_to_df(participants: list[Participant], page_name: str) -> pl.DataF
     Args:
         participants: List of Participant objects.
         page_name: The page/route name (without 'pageData_' prefix).
+        schema: Columns to return, in order, with their types (see
+            ColumnBuffers.to_frame()).
+        schema_overrides: Types for some columns; the rest are inferred from
+            all values across participants.
+        downcast: Whether to shrink inferred column types (see downcast_df()).
 
     Returns:
         DataFrame with page data from all participants.
     """
-    all_rows = []
+    buffers = ColumnBuffers()
     for p in participants:
-        page_data = p.get_page_data(page_name)
-        if not page_data:
+        _append_page_data(buffers, p.id, p.get_page_data(page_name))
+    return _finish_frame(buffers, schema, schema_overrides, downcast)
+
+
+def page_data_to_dfs(
+    participants: Iterable[Participant],
+    pages: Sequence[str] | None = None,
+    schema_overrides: SchemaDict | None = None,
+    downcast: bool = False,
+) -> dict[str, pl.DataFrame]:
+    """Extract several pages' data into DataFrames in one pass.
+
+    Args:
+        participants: Participant objects.
+        pages: Page/route names (without 'pageData_' prefix). Defaults to
+            every page found in the participants' data.
+        schema_overrides: Types for columns of any page that has them.
+        downcast: Whether to shrink inferred column types (see downcast_df()).
+
+    Returns:
+        Dict mapping each page name to its DataFrame (empty if the page has
+        no data), in the order given, or sorted if ``pages`` is None.
+    """
+    buffers: dict[str, ColumnBuffers]
+    if pages is None:
+        buffers = {}
+        for p in participants:
+            for page_name in p.page_names:
+                page_buffers = buffers.get(page_name)
+                if page_buffers is None:
+                    page_buffers = buffers[page_name] = ColumnBuffers()
+                _append_page_data(page_buffers, p.id, p.get_page_data(page_name))
+        buffers = dict(sorted(buffers.items()))
+    else:
+        buffers = {page_name: ColumnBuffers() for page_name in pages}
+        for p in participants:
+            for page_name, page_buffers in buffers.items():
+                _append_page_data(page_buffers, p.id, p.get_page_data(page_name))
+
+    return {
+        page_name: _finish_frame(page_buffers, None, schema_overrides, downcast)
+        for page_name, page_buffers in buffers.items()
+    }
+
+
+def _append_page_data(
+    buffers: ColumnBuffers, participant_id: str, page_data: dict[str, Any] | None
+) -> None:
+    """Append one row per data entry of a participant's page data.
+
+    Args:
+        buffers: Buffers to append rows to.
+        participant_id: ID of the participant the page data belongs to.
+        page_data: The participant's pageData_<page> dict, or None.
+    """
+    if not page_data:
+        return
+
+    # Handle visit-based structure (visit_0, visit_1, etc.)
+    keys = {"participant_id": participant_id}
+    for visit_key, visit_data in page_data.items():
+        if not visit_key.startswith("visit_"):
             continue
+        _append_visit(buffers, keys, int(visit_key.split("_")[1]), visit_data)
 
-        # Handle visit-based structure (visit_0, visit_1, etc.)
-        for visit_key, visit_data in page_data.items():
-            if not visit_key.startswith("visit_"):
-                continue
 
-            visit_num = int(visit_key.split("_")[1])
-            data_list = visit_data.get("data", [])
-            timestamps = visit_data.get("timestamps", [])
-
-            for i, data in enumerate(data_list):
-                row: dict[str, Any] = {
-                    "participant_id": p.id,
-                    "visit": visit_num,
-                    "index": i,
-                }
-                if i < len(timestamps):
-                    row["timestamp"] = timestamps[i]
-                row.update(data)
-                all_rows.append(row)
-
-    if not all_rows:
-        return pl.DataFrame()
+def _append_visit(
+    buffers: ColumnBuffers,
+    keys: dict[str, Any],
+    visit_num: int,
+    visit_data: dict[str, Any],
+    last_only: bool = False,
+    fill_timestamps: bool = False,
+) -> None:
+    """Append one row per data entry of a single page visit.
+
+    Args:
+        buffers: Buffers to append rows to.
+        keys: Columns with the same value in every row (e.g. participant_id).
+        visit_num: The visit number.
+        visit_data: The visit's dict, holding 'data' and 'timestamps' lists.
+        last_only: Whether to append only the visit's last entry.
+        fill_timestamps: Whether to add null timestamps when the visit has
+            none, so the timestamp column comes before the data fields.
+    """
+    data_list = visit_data.get("data", [])
+    timestamps = visit_data.get("timestamps", [])
+    m = len(data_list)
+    if not m:
+        return
+
+    start = m - 1 if last_only else 0
+    n = m - start
+    fields: dict[str, Sequence[Any]] = {key: [value] * n for key, value in keys.items()}
+    fields["visit"] = [visit_num] * n
+    fields["index"] = range(start, m)
+    if timestamps:
+        stamps = timestamps[start:m]
+        fields["timestamp"] = [*stamps, *[None] * (n - len(stamps))]
+    elif fill_timestamps:
+        fields["timestamp"] = [None] * n
+    buffers.extend(data_list[start:] if start else data_list, fields)
+
+
+def forms_to_df(
+    participants: Iterable[Participant],
+    form_names: Sequence[str],
+    which: str = "last",
+    layout: str = "long",
+    schema_overrides: SchemaDict | None = None,
+    downcast: bool = False,
+) -> pl.DataFrame:
+    """Extract the submissions of several forms into one DataFrame.
 
-    return pl.DataFrame(all_rows)
+    Submissions are read from each form's pageData_<form> field. As with
+    the demographics, device_info and feedback properties, a form saved in
+    its legacy top-level field (see Participant.get_legacy_form()) is taken
+    from there instead, as a single submission with null visit and index.
+
+    Args:
+        participants: Participant objects.
+        form_names: Form/page names (e.g. 'demograph', 'device', 'feedback').
+        which: 'last' for each participant's most recent submission of each
+            form (last visit, last entry), or 'all' for every submission.
+        layout: 'long' for one row per submission, with participant_id,
+            form, visit, index and timestamp columns followed by the forms'
+            fields (forms that share a field share its column). 'wide' for
+            one row per participant, with each form's fields in
+            '<form>_<field>' columns; requires which='last'.
+        schema_overrides: Types for some columns; the rest are inferred from
+            all values.
+        downcast: Whether to shrink inferred column types (see downcast_df()).
+
+    Returns:
+        DataFrame of form submissions.
+
+    Raises:
+        ValueError: If which or layout is not a known value, or the wide
+            layout is requested with which='all'.
+    """
+    if which not in ("last", "all"):
+        raise ValueError(f"which must be 'last' or 'all', got {which!r}")
+    if layout not in ("long", "wide"):
+        raise ValueError(f"layout must be 'long' or 'wide', got {layout!r}")
+    if layout == "wide" and which != "last":
+        raise ValueError("The wide layout holds one submission per form; use which='last'")
+
+    last_only = which == "last"
+    buffers = ColumnBuffers()
+    for p in participants:
+        if layout == "wide":
+            row: dict[str, Any] = {"participant_id": p.id}
+            for form_name in form_names:
+                entry = p.get_legacy_form(form_name) or p.get_form(form_name)
+                if entry:
+                    for key, value in entry.items():
+                        row[f"{form_name}_{key}"] = value
+            buffers.append(row)
+            continue
+
+        for form_name in form_names:
+            keys = {"participant_id": p.id, "form": form_name}
+            legacy = p.get_legacy_form(form_name)
+            if legacy:
+                buffers.append({**keys, "visit": None, "index": None, "timestamp": None, **legacy})
+                continue
+            visits = p.page_visits(form_name)
+            if not visits:
+                continue
+            if last_only:
+                # The most recent submission is the last entry of the last visit
+                visit_num = next(reversed(visits))
+                _append_visit(
+                    buffers, keys, visit_num, visits[visit_num], last_only=True, fill_timestamps=True
+                )
+            else:
+                for visit_num, visit_data in visits.items():
+                    _append_visit(buffers, keys, visit_num, visit_data, fill_timestamps=True)
+
+    return _finish_frame(buffers, None, schema_overrides, downcast)
 
 
 def conditions_to_df(participants: list[Participant]) -> pl.DataFrame:
@@ -0,0 +1,108 @@
+"""Tests for JSON decoder backends."""
+
+import json
+import sys
+
+import pytest
+
+from smiledata import backends, load_folder, load_json
+from smiledata.backends import (
+    available_backends,
+    get_decoder,
+    get_projecting_decoder,
+    resolve_backend,
+    supports_buffers,
+)
+from smiledata.loader import load_latest
+
+
+@pytest.fixture
+def no_backend_cache():
+    """Clear memoized backend imports around a test."""
+    backends._load_backend.cache_clear()
+    yield
+    backends._load_backend.cache_clear()
+
+
+class TestBackendSelection:
+    """Test choosing a decoder backend."""
+
+    def test_stdlib_always_available(self):
+        assert available_backends()[-1] == "json"
+
+    def test_auto_picks_fastest_available(self):
+        assert resolve_backend() == available_backends()[0]
+        assert resolve_backend("auto") == available_backends()[0]
+
+    def test_explicit_stdlib(self):
+        assert get_decoder("json") is json.loads
+
+    def test_stdlib_needs_bytes(self):
+        assert supports_buffers("json") is False
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            get_decoder("yaml")
+
+    def test_missing_backend(self, monkeypatch, no_backend_cache):
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        assert "orjson" not in available_backends()
+        with pytest.raises(ImportError):
+            get_decoder("orjson")
+
+    def test_falls_back_to_stdlib(self, monkeypatch, no_backend_cache):
+        for name in ("orjson", "msgspec", "simdjson"):
+            monkeypatch.setitem(sys.modules, name, None)
+        assert resolve_backend() == "json"
+
+
+@pytest.mark.parametrize("backend", available_backends())
+class TestEachBackend:
+    """Every installed backend decodes exports identically."""
+
+    def test_decodes_bytes_and_str(self, backend, complete_participant_data):
+        decode = get_decoder(backend)
+        text = json.dumps([complete_participant_data])
+        assert decode(text.encode()) == [complete_participant_data]
+        assert decode(text) == [complete_participant_data]
+
+    def test_buffer_support(self, backend, complete_participant_data):
+        if not supports_buffers(backend):
+            pytest.skip("backend needs bytes")
+        buf = memoryview(json.dumps(complete_participant_data).encode())
+        assert get_decoder(backend)(buf) == complete_participant_data
+
+    def test_invalid_json_raises_json_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            get_decoder(backend)(b"not valid json {{{")
+
+    def test_load_json(self, backend, temp_json_file, complete_participant_data):
+        ds = load_json(temp_json_file, backend=backend)
+        assert ds[0].raw_data == complete_participant_data
+
+    def test_load_folder(self, backend, temp_json_folder):
+        assert len(load_folder(temp_json_folder, backend=backend)) == 2
+
+    def test_load_latest(self, backend, temp_json_file):
+        assert len(load_latest(temp_json_file.parent, backend=backend)) == 1
+
+
+class TestProjectingDecoder:
+    """Test msgspec-based projection while decoding."""
+
+    @pytest.fixture(autouse=True)
+    def needs_msgspec(self):
+        pytest.importorskip("msgspec")
+
+    def test_keeps_only_requested_keys(self):
+        decode = get_projecting_decoder(("id", "pageData_quiz", "odd-key"))
+        records = decode(b'[{"id": "a", "big": {"x": [1]}, "odd-key": null}, {"pageData_quiz": 1}]')
+        assert records == [{"id": "a", "odd-key": None}, {"pageData_quiz": 1}]
+
+    def test_invalid_json(self):
+        with pytest.raises(json.JSONDecodeError):
+            get_projecting_decoder(("id",))(b"not valid json {{{")
+
+    def test_not_an_array_of_objects(self):
+        with pytest.raises(json.JSONDecodeError):
+            get_projecting_decoder(("id",))(b"[1, 2]")
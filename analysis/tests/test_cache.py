@@ -0,0 +1,159 @@
+"""Tests for the on-disk columnar export cache."""
+
+import json
+import os
+
+import pytest
+
+from smiledata import SmileDataset, load_json
+from smiledata.cache import CACHE_DIR_NAME, _cache_files, load_cached
+from smiledata.lazy import LazyParticipants
+from smiledata.loader import load_latest
+
+
+@pytest.fixture
+def export_file(tmp_path, complete_participant_data, withdrawn_participant_data):
+    """An export file with two participants."""
+    file_path = tmp_path / "export.json"
+    file_path.write_text(json.dumps([complete_participant_data, withdrawn_participant_data]))
+    return file_path
+
+
+class CountingLoader:
+    """Wraps load_json and counts how often the export is actually parsed."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return load_json(path)
+
+
+class TestLoadCached:
+    """Test cache hits, misses and invalidation."""
+
+    def test_miss_builds_cache(self, export_file):
+        loader = CountingLoader()
+        ds = load_cached(export_file, loader)
+        assert loader.calls == 1
+        assert len(ds) == 2
+        data_file, meta_file = _cache_files(export_file, export_file.parent / CACHE_DIR_NAME)
+        assert data_file.exists()
+        assert meta_file.exists()
+
+    def test_hit_skips_parsing(self, export_file):
+        loader = CountingLoader()
+        load_cached(export_file, loader)
+        ds = load_cached(export_file, loader)
+        assert loader.calls == 1
+        assert isinstance(ds, SmileDataset)
+        assert [p.id for p in ds] == ["test-participant-001", "test-participant-002"]
+
+    def test_hit_round_trips_raw_data(self, export_file, complete_participant_data):
+        load_cached(export_file, CountingLoader())
+        ds = load_cached(export_file, CountingLoader())
+        assert ds[0].raw_data == complete_participant_data
+        assert ds.complete_count == 1
+        assert ds.withdrawn_count == 1
+
+    def test_hit_indexes_conditions_from_table(self, export_file):
+        load_cached(export_file, CountingLoader())
+        ds = load_cached(export_file, CountingLoader())
+        assert len(ds.by_condition(condition="A")) == 2
+        assert len(ds.by_condition(condition="B")) == 0
+        assert len(ds._participants._cache) == 0
+
+    def test_changed_file_rebuilds(self, export_file, complete_participant_data):
+        loader = CountingLoader()
+        load_cached(export_file, loader)
+
+        export_file.write_text(json.dumps([complete_participant_data]))
+        ds = load_cached(export_file, loader)
+        assert loader.calls == 2
+        assert len(ds) == 1
+
+    def test_touched_file_with_same_content_hits(self, export_file):
+        loader = CountingLoader()
+        load_cached(export_file, loader)
+
+        stat = export_file.stat()
+        os.utime(export_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        load_cached(export_file, loader)
+        assert loader.calls == 1
+
+    def test_corrupt_cache_rebuilds(self, export_file):
+        loader = CountingLoader()
+        load_cached(export_file, loader)
+        data_file, _ = _cache_files(export_file, export_file.parent / CACHE_DIR_NAME)
+        data_file.write_bytes(b"garbage")
+
+        ds = load_cached(export_file, loader)
+        assert loader.calls == 2
+        assert len(ds) == 2
+
+    def test_custom_cache_dir(self, export_file, tmp_path):
+        cache_dir = tmp_path / "elsewhere"
+        load_cached(export_file, CountingLoader(), cache_dir)
+        assert any(cache_dir.glob("*.arrow"))
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_cached(tmp_path / "missing.json", CountingLoader())
+
+
+class TestLoaderCacheOption:
+    """Test the cache option on the loader functions."""
+
+    def test_load_json_cache(self, export_file):
+        first = load_json(export_file, cache=True)
+        second = load_json(export_file, cache=True)
+        assert [p.id for p in first] == [p.id for p in second]
+        assert (export_file.parent / CACHE_DIR_NAME).is_dir()
+
+    def test_load_latest_cache(self, export_file):
+        load_latest(export_file.parent, cache=True)
+        ds = load_latest(export_file.parent, cache=True)
+        assert len(ds) == 2
+
+
+class TestLazyParticipants:
+    """Test lazily decoded participant sequences."""
+
+    @pytest.fixture
+    def records(self):
+        return [json.dumps({"id": f"p-{i}", "done": i % 2 == 0}).encode() for i in range(10)]
+
+    def test_len_and_index(self, records):
+        lazy = LazyParticipants(records)
+        assert len(lazy) == 10
+        assert lazy[3].id == "p-3"
+        assert lazy[-1].id == "p-9"
+
+    def test_decoded_once_while_cached(self, records):
+        lazy = LazyParticipants(records)
+        assert lazy[2] is lazy[2]
+
+    def test_cache_is_bounded(self, records):
+        lazy = LazyParticipants(records, cache_size=3)
+        for p in lazy:
+            assert p.id.startswith("p-")
+        assert len(lazy._cache) == 3
+
+    def test_slice_shares_cache(self, records):
+        lazy = LazyParticipants(records)
+        first = lazy[4]
+        subset = lazy[2:6]
+        assert isinstance(subset, LazyParticipants)
+        assert len(subset) == 4
+        assert subset[2] is first
+
+    def test_index_error(self, records):
+        with pytest.raises(IndexError):
+            LazyParticipants(records)[10]
+
+    def test_dataset_slice_stays_lazy(self, records):
+        ds = SmileDataset(LazyParticipants(records))
+        subset = ds[5:]
+        assert len(subset) == 5
+        assert subset[0].id == "p-5"
@@ -0,0 +1,125 @@
+"""Tests for Parquet export and reload of datasets."""
+
+import polars as pl
+import pytest
+
+from smiledata import Participant, SmileDataset
+from smiledata.columnar import (
+    DEMOGRAPHICS_FILE,
+    PARTICIPANTS_FILE,
+    RAW_COLUMN,
+    TRIALS_FILE,
+    page_data_path,
+)
+from smiledata.lazy import LazyParticipants
+
+
+class TestToParquet:
+    """Test writing datasets as Parquet tables."""
+
+    def test_writes_tables(self, sample_dataset, tmp_path):
+        sample_dataset.to_parquet(tmp_path / "out")
+        out = tmp_path / "out"
+        assert (out / PARTICIPANTS_FILE).exists()
+        assert (out / DEMOGRAPHICS_FILE).exists()
+        assert (out / TRIALS_FILE).exists()
+        for page in sample_dataset.available_pages():
+            assert page_data_path(out, page).exists()
+
+    def test_participant_table(self, sample_dataset, tmp_path):
+        sample_dataset.to_parquet(tmp_path)
+        table = pl.read_parquet(tmp_path / PARTICIPANTS_FILE)
+        assert table[RAW_COLUMN].dtype == pl.Binary
+        expected = sample_dataset.to_participants_df()
+        assert table.drop(RAW_COLUMN).equals(expected)
+
+    def test_page_table_matches_to_page_data_df(self, sample_dataset, tmp_path):
+        sample_dataset.to_parquet(tmp_path)
+        table = pl.read_parquet(page_data_path(tmp_path, "quiz"))
+        assert table.equals(sample_dataset.to_page_data_df("quiz"))
+
+    def test_no_trials_table_without_study_data(self, pagedata_participant, tmp_path):
+        SmileDataset([pagedata_participant]).to_parquet(tmp_path)
+        assert not (tmp_path / TRIALS_FILE).exists()
+
+    def test_rewrite_drops_stale_pages(self, sample_dataset, pagedata_participant, tmp_path):
+        sample_dataset.to_parquet(tmp_path)
+        SmileDataset([pagedata_participant]).to_parquet(tmp_path)
+        assert not page_data_path(tmp_path, "trial").exists()
+        assert page_data_path(tmp_path, "experiment").exists()
+
+
+class TestFromParquet:
+    """Test reloading datasets from Parquet tables."""
+
+    def test_round_trip(self, sample_dataset, tmp_path):
+        sample_dataset.to_parquet(tmp_path)
+        loaded = SmileDataset.from_parquet(tmp_path)
+        assert isinstance(loaded._participants, LazyParticipants)
+        assert len(loaded) == len(sample_dataset)
+        assert [p.raw_data for p in loaded] == [p.raw_data for p in sample_dataset]
+        assert loaded.summary() == sample_dataset.summary()
+        assert loaded.is_columnar
+
+    def test_round_trip_filtered(self, sample_dataset, tmp_path):
+        sample_dataset.complete_only().to_parquet(tmp_path)
+        loaded = SmileDataset.from_parquet(tmp_path)
+        assert [p.id for p in loaded] == ["test-participant-001", "test-participant-005"]
+        assert all(isinstance(p, Participant) for p in loaded)
+
+    def test_condition_index_from_table(self, complete_participant_data, tmp_path):
+        """Only conditions coerced from mixed types are re-read from the records."""
+        participants = [
+            Participant({**complete_participant_data, "id": pid, "conditions": conditions})
+            for pid, conditions in [
+                ("a", {"group": "A", "c": 1}),
+                ("b", {"group": "B", "c": "1"}),
+            ]
+        ]
+        SmileDataset(participants).to_parquet(tmp_path)
+        loaded = SmileDataset.from_parquet(tmp_path)
+        group_b = loaded.by_condition(group="B")
+        assert list(loaded.groupby_condition("group")) == [("A",), ("B",)]
+        assert len(loaded._participants._cache) == 0
+        assert [p.id for p in group_b] == ["b"]
+        assert [p.id for p in loaded.by_condition(c=1)] == ["a"]
+        assert [p.id for p in loaded.by_condition(c="1")] == ["b"]
+
+    def test_empty_dataset(self, tmp_path):
+        SmileDataset([]).to_parquet(tmp_path)
+        assert len(SmileDataset.from_parquet(tmp_path)) == 0
+
+    def test_missing_directory(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            SmileDataset.from_parquet(tmp_path / "missing")
+
+
+class TestStoredLazyFrames:
+    """Test LazyFrames over a dataset read from Parquet."""
+
+    @pytest.fixture
+    def stored(self, sample_dataset, tmp_path):
+        sample_dataset.to_parquet(tmp_path)
+        return SmileDataset.from_parquet(tmp_path)
+
+    def test_trials_scan_parquet(self, stored, sample_dataset):
+        lf = stored.to_trials_lazy()
+        assert "Parquet SCAN" in lf.select("rt").explain()
+        assert lf.collect().equals(sample_dataset.to_trials_df())
+
+    def test_page_scan_parquet(self, stored, sample_dataset):
+        lf = stored.to_trials_lazy(page="trial")
+        assert "Parquet SCAN" in lf.explain()
+        assert lf.collect().equals(sample_dataset.to_page_data_df("trial"))
+
+    def test_view_filters_scan(self, stored, sample_dataset):
+        view = stored.complete_only()
+        expected = sample_dataset.complete_only().to_trials_df(include_participant_id=False)
+        result = view.to_trials_lazy(include_participant_id=False).collect()
+        assert result.equals(expected)
+
+    def test_missing_page_falls_back(self, stored):
+        assert stored.to_trials_lazy(page="nonexistent").collect().is_empty()
+
+    def test_participants_lazy_is_columnar(self, stored):
+        assert stored.to_participants_lazy().collect().equals(stored.to_participants_df())
@@ -1,9 +1,13 @@
 """Tests for SmileDataset class."""
 
+import json
+
 import polars as pl
 import pytest
 
 from smiledata import Participant, SmileDataset
+from smiledata.lazy import LazyParticipants
+from smiledata.transforms import page_data_to_df
 
 
 class TestDatasetBasics:
@@ -190,6 +194,49 @@ class TestDatasetDataFrames:
         df = sample_dataset.to_page_data_df("nonexistent")
         assert len(df) == 0
 
+    def test_to_trials_df_schema_options(self, sample_dataset):
+        df = sample_dataset.to_trials_df(schema_overrides={"rt": pl.Float64}, downcast=True)
+        assert df.schema["rt"] == pl.Float64
+        assert df.schema["participant_id"] == pl.Categorical
+        assert len(df) == len(sample_dataset.to_trials_df())
+
+    def test_to_trials_df_page_schema(self, sample_dataset):
+        df = sample_dataset.to_trials_df(page="trial", schema={"participant_id": pl.String})
+        assert df.columns == ["participant_id"]
+        assert len(df) == len(sample_dataset.to_page_data_df("trial"))
+
+    def test_categorical_frames_join(self, sample_dataset):
+        participants = sample_dataset.to_participants_df(categorical=True)
+        trials = sample_dataset.to_trials_df(categorical=True)
+        demographics = sample_dataset.demographics_df(categorical=True)
+        ids = [p.id for p in sample_dataset]
+        assert participants.schema["id"] == pl.Enum(ids)
+        assert trials.schema["participant_id"] == pl.Enum(ids)
+        assert demographics.schema["participant_id"] == pl.Enum(ids)
+        assert participants.schema["recruitment_service"] == pl.Categorical
+
+        joined = trials.join(participants, left_on="participant_id", right_on="id")
+        assert len(joined) == len(trials)
+
+    def test_categorical_view_shares_enum(self, sample_dataset):
+        trials = sample_dataset.complete_only().to_page_data_df("trial", categorical=True)
+        participants = sample_dataset.to_participants_df(categorical=["id"])
+        assert trials.schema["participant_id"] == participants.schema["id"]
+        assert participants.schema["recruitment_service"] == pl.String
+
+    def test_to_page_data_dfs(self, sample_dataset):
+        dfs = sample_dataset.to_page_data_dfs(["quiz", "trial", "nonexistent"])
+        assert list(dfs) == ["quiz", "trial", "nonexistent"]
+        assert dfs["quiz"].equals(sample_dataset.to_page_data_df("quiz"))
+        assert dfs["trial"].equals(sample_dataset.to_page_data_df("trial"))
+        assert len(dfs["nonexistent"]) == 0
+
+    def test_to_page_data_dfs_all_pages(self, sample_dataset):
+        dfs = sample_dataset.to_page_data_dfs()
+        assert list(dfs) == sample_dataset.available_pages()
+        for page_name, df in dfs.items():
+            assert df.equals(sample_dataset.to_page_data_df(page_name))
+
 
 class TestDatasetEdgeCases:
     """Test edge cases."""
@@ -216,3 +263,446 @@ class TestDatasetEdgeCases:
         assert len(ds) == 1
         assert ds.complete_count == 1
         assert ds.summary()["complete"] == 1
+
+
+class TestColumnarDataset:
+    """Test columnar-backed datasets."""
+
+    @pytest.fixture
+    def columnar(self, sample_dataset):
+        return sample_dataset.to_columnar()
+
+    def test_to_columnar(self, sample_dataset, columnar):
+        assert not sample_dataset.is_columnar
+        assert columnar.is_columnar
+        assert columnar.to_columnar() is columnar
+        assert columnar.to_participants_df().equals(sample_dataset.to_participants_df())
+
+    def test_counts_match(self, sample_dataset, columnar):
+        assert columnar.complete_count == sample_dataset.complete_count
+        assert columnar.withdrawn_count == sample_dataset.withdrawn_count
+        assert columnar.summary() == sample_dataset.summary()
+
+    @pytest.mark.parametrize(
+        "select",
+        [
+            lambda ds: ds.complete_only(),
+            lambda ds: ds.by_condition(condition="B"),
+            lambda ds: ds.by_condition(condition="A", block_order="1"),
+            lambda ds: ds.by_condition(missing=None),
+            lambda ds: ds.by_condition(missing="x"),
+            lambda ds: ds.by_condition(condition=1),
+            lambda ds: ds.by_recruitment("prolific"),
+            lambda ds: ds.filter(lambda p: p.withdrawn),
+            lambda ds: ds[1:4],
+        ],
+    )
+    def test_filters_match(self, sample_dataset, columnar, select):
+        expected = select(sample_dataset)
+        result = select(columnar)
+        assert result.is_columnar
+        assert [p.id for p in result] == [p.id for p in expected]
+        if len(expected):
+            assert result.to_participants_df().equals(expected.to_participants_df())
+        else:
+            assert result.to_participants_df().height == 0
+
+    def test_filter_chain(self, columnar):
+        result = columnar.complete_only().by_condition(condition="A")
+        assert [p.id for p in result] == ["test-participant-001"]
+        assert result.to_participants_df()["id"].to_list() == ["test-participant-001"]
+
+    def test_empty(self):
+        ds = SmileDataset([]).to_columnar()
+        assert ds.complete_count == 0
+        assert len(ds.complete_only()) == 0
+        assert len(ds.by_condition(condition="A")) == 0
+
+
+class TestDatasetWhere:
+    """Test expression-based filtering."""
+
+    def test_where(self, sample_dataset):
+        result = sample_dataset.where(pl.col("condition_condition") == "B")
+        assert [p.id for p in result] == ["test-participant-005"]
+        assert result.is_columnar
+
+    def test_where_matches_filter(self, sample_dataset):
+        result = sample_dataset.where(pl.col("is_complete"))
+        expected = sample_dataset.filter(lambda p: p.is_complete)
+        assert [p.id for p in result] == [p.id for p in expected]
+
+    def test_where_multiple_expressions(self, sample_dataset):
+        result = sample_dataset.where(
+            pl.col("condition_condition") == "A", pl.col("consented"), ~pl.col("withdrawn")
+        )
+        assert [p.id for p in result] == ["test-participant-001", "test-participant-003"]
+
+    def test_where_chain(self, sample_dataset):
+        result = sample_dataset.where(pl.col("consented")).where(pl.col("done"))
+        assert len(result) == len(sample_dataset.filter(lambda p: p.consented and p.done))
+        assert result.to_participants_df().height == len(result)
+
+    def test_where_no_match(self, sample_dataset):
+        assert len(sample_dataset.where(pl.col("id") == "nonexistent")) == 0
+
+    def test_where_unknown_column(self, sample_dataset):
+        with pytest.raises(pl.exceptions.ColumnNotFoundError):
+            sample_dataset.where(pl.col("nonexistent") == 1)
+
+    def test_where_requires_expression(self, sample_dataset):
+        with pytest.raises(ValueError):
+            sample_dataset.where()
+
+    def test_where_empty_dataset(self):
+        assert len(SmileDataset([]).where(pl.col("done"))) == 0
+
+    def test_where_keeps_receiver_non_columnar(self, sample_dataset):
+        sample_dataset.where(pl.col("done"))
+        assert not sample_dataset.is_columnar
+        sample_dataset[1].raw_data["withdrawn"] = False
+        sample_dataset.invalidate()
+        assert sample_dataset.complete_count == sum(p.is_complete for p in sample_dataset)
+        assert len(sample_dataset.complete_only()) == sample_dataset.complete_count
+
+
+class TestConditionIndex:
+    """Test indexed condition and recruitment lookups."""
+
+    @pytest.fixture(params=["list", "columnar"])
+    def dataset(self, request, sample_dataset):
+        return sample_dataset if request.param == "list" else sample_dataset.to_columnar()
+
+    def test_index_built_once(self, dataset):
+        dataset.by_condition(condition="A")
+        index = dataset._condition_index()
+        dataset.by_recruitment("prolific")
+        assert dataset._condition_index() is index
+
+    @pytest.mark.parametrize(
+        "conditions",
+        [
+            {"condition": "A"},
+            {"condition": "B"},
+            {"condition": "A", "block_order": "1"},
+            {"condition": "C"},
+            {"missing": None},
+            {"missing": "x"},
+            {"condition": 1},
+            {},
+        ],
+    )
+    def test_matches_scan(self, dataset, conditions):
+        expected = [
+            p.id
+            for p in dataset
+            if all(p.conditions.get(k) == v for k, v in conditions.items())
+        ]
+        assert [p.id for p in dataset.by_condition(**conditions)] == expected
+
+    def test_missing_condition_matches_none(self, complete_participant_data):
+        other = {**complete_participant_data, "id": "other", "conditions": {}}
+        ds = SmileDataset([Participant(complete_participant_data), Participant(other)])
+        assert [p.id for p in ds.by_condition(condition=None)] == ["other"]
+
+    def test_unhashable_values_fall_back(self, complete_participant_data):
+        data = {**complete_participant_data, "conditions": {"order": [1, 2]}}
+        ds = SmileDataset([Participant(data)])
+        assert len(ds.by_condition(order=[1, 2])) == 1
+        assert list(ds.groupby_condition()) == [()]
+        with pytest.raises(TypeError):
+            ds.groupby_condition("order")
+
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_mixed_type_values(self, complete_participant_data, columnar):
+        participants = [
+            Participant({**complete_participant_data, "id": pid, "conditions": {"c": value}})
+            for pid, value in [("int", 1), ("str", "1"), ("other", "x")]
+        ]
+        ds = SmileDataset(participants)
+        if columnar:
+            ds = ds.to_columnar()
+        assert [p.id for p in ds.by_condition(c="1")] == ["str"]
+        assert [p.id for p in ds.by_condition(c=1)] == ["int"]
+        assert [p.id for p in ds[1:].by_condition(c="1")] == ["str"]
+        assert list(ds.groupby_condition("c")) == [(1,), ("1",), ("x",)]
+        assert list(ds.groupby_condition()) == [(1,), ("1",), ("x",)]
+
+    def test_by_recruitment(self, dataset):
+        assert len(dataset.by_recruitment("prolific")) == 5
+        assert len(dataset.by_recruitment("mturk")) == 0
+
+    def test_groupby_condition(self, dataset):
+        groups = dataset.groupby_condition("condition")
+        assert list(groups) == [("A",), ("B",)]
+        assert len(groups[("A",)]) == 4
+        assert [p.id for p in groups[("B",)]] == ["test-participant-005"]
+
+    def test_groupby_condition_all_keys(self, dataset):
+        groups = dataset.groupby_condition()
+        assert sum(len(g) for g in groups.values()) == len(dataset)
+        for group, subset in groups.items():
+            assert len(group) == len(dataset._condition_index().conditions)
+            assert subset.is_columnar == dataset.is_columnar
+
+    def test_groupby_condition_empty(self):
+        assert SmileDataset([]).groupby_condition("condition") == {}
+
+
+class TestDatasetViews:
+    """Test zero-copy dataset views."""
+
+    def ids(self, ds):
+        return [p.id for p in ds]
+
+    def test_filters_return_views(self, sample_dataset):
+        for view in (
+            sample_dataset[1:3],
+            sample_dataset.complete_only(),
+            sample_dataset.filter(lambda p: p.withdrawn),
+            sample_dataset.by_condition(condition="A"),
+            sample_dataset.where(pl.col("done")),
+        ):
+            assert view.is_view
+            assert view._root is sample_dataset
+        assert not sample_dataset.is_view
+
+    def test_views_compose(self, sample_dataset):
+        all_ids = self.ids(sample_dataset)
+        assert self.ids(sample_dataset[1:][1:3]) == all_ids[2:4]
+        assert self.ids(sample_dataset[::-1][:2]) == all_ids[::-1][:2]
+        chained = sample_dataset[1:].complete_only()
+        assert chained._root is sample_dataset
+        assert self.ids(chained) == [p.id for p in sample_dataset[1:] if p.is_complete]
+
+    def test_view_indexing(self, sample_dataset):
+        view = sample_dataset[1:4]
+        assert view[0] is sample_dataset[1]
+        assert view[-1] is sample_dataset[3]
+        assert len(view) == 3
+
+    def test_view_shares_condition_index(self, sample_dataset):
+        view = sample_dataset[2:]
+        assert view._condition_index() is sample_dataset._condition_index()
+        expected = [p.id for p in view if p.conditions.get("condition") == "A"]
+        assert self.ids(view.by_condition(condition="A")) == expected
+        assert self.ids(view.by_recruitment("prolific")) == self.ids(view)
+        groups = view.groupby_condition("condition")
+        assert {k: self.ids(v) for k, v in groups.items()} == {
+            ("A",): expected,
+            ("B",): ["test-participant-005"],
+        }
+
+    def test_columnar_view(self, sample_dataset):
+        columnar = sample_dataset.to_columnar()
+        view = columnar[::2]
+        assert view.is_columnar
+        assert view.to_participants_df()["id"].to_list() == self.ids(view)
+
+    def test_to_columnar_on_view(self, sample_dataset):
+        view = sample_dataset[1:].to_columnar()
+        assert view.is_view and view.is_columnar
+        subset = view.where(pl.col("consented"))
+        assert subset.to_participants_df()["id"].to_list() == self.ids(subset)
+
+    def test_materialize(self, sample_dataset):
+        view = sample_dataset.complete_only()
+        copy = view.materialize()
+        assert not copy.is_view
+        assert isinstance(copy._participants, list)
+        assert self.ids(copy) == self.ids(view)
+        assert sample_dataset.materialize() is sample_dataset
+
+    def test_materialize_keeps_lazy(self, sample_dataset):
+        records = [json.dumps(p.raw_data) for p in sample_dataset]
+        ds = SmileDataset(LazyParticipants(records))
+        copy = ds[1:3].materialize()
+        assert isinstance(copy._participants, LazyParticipants)
+        assert self.ids(copy) == self.ids(sample_dataset)[1:3]
+
+    def test_materialize_columnar(self, sample_dataset):
+        copy = sample_dataset.to_columnar()[1:3].materialize()
+        assert copy.is_columnar
+        assert copy.to_participants_df()["id"].to_list() == self.ids(copy)
+
+
+class TestDatasetMemoization:
+    """Test memoized counts and page names."""
+
+    @pytest.fixture
+    def scans(self, monkeypatch):
+        calls = []
+        original = Participant.is_complete
+
+        def counting(p):
+            calls.append(p.id)
+            return original.fget(p)
+
+        monkeypatch.setattr(Participant, "is_complete", property(counting))
+        return calls
+
+    def test_single_pass(self, sample_dataset, scans):
+        summary = sample_dataset.summary()
+        repr(sample_dataset)
+        assert sample_dataset.complete_count == summary["complete"]
+        assert sample_dataset.withdrawn_count == summary["withdrawn"]
+        assert sample_dataset.available_pages()
+        assert len(scans) == len(sample_dataset)
+
+    def test_available_pages_returns_copy(self, sample_dataset):
+        sample_dataset.available_pages().append("extra")
+        assert "extra" not in sample_dataset.available_pages()
+
+    def test_invalidate(self, sample_dataset):
+        assert sample_dataset.withdrawn_count == 1
+        sample_dataset[0].raw_data["withdrawn"] = True
+        assert sample_dataset.withdrawn_count == 1
+        sample_dataset.invalidate()
+        assert sample_dataset.withdrawn_count == 2
+        assert sample_dataset.complete_count == 1
+
+    def test_invalidate_reaches_views(self, sample_dataset):
+        view = sample_dataset[:2]
+        assert view.withdrawn_count == 1
+        assert len(view.by_condition(condition="A")) == 2
+        sample_dataset[0].raw_data["withdrawn"] = True
+        sample_dataset[0].raw_data["conditions"] = {"condition": "B"}
+        view.invalidate()
+        assert view.withdrawn_count == 2
+        assert len(view.by_condition(condition="A")) == 1
+        assert len(sample_dataset.by_condition(condition="B")) == 2
+
+    def test_invalidate_pages(self, sample_dataset):
+        sample_dataset[0].raw_data["pageData_extra"] = {}
+        sample_dataset.invalidate()
+        assert "extra" in sample_dataset.available_pages()
+
+
+class TestPageIndex:
+    """Test the page-name index used to skip participants without a page."""
+
+    @pytest.fixture
+    def mixed_dataset(self, complete_participant_data, pagedata_only_participant_data):
+        return SmileDataset(
+            [
+                Participant(complete_participant_data),
+                Participant(pagedata_only_participant_data),
+            ]
+        )
+
+    @pytest.fixture
+    def probes(self, monkeypatch):
+        calls = []
+        original = Participant.get_page_data
+
+        def counting(p, page_name):
+            calls.append(p.id)
+            return original(p, page_name)
+
+        monkeypatch.setattr(Participant, "get_page_data", counting)
+        return calls
+
+    def test_available_pages(self, mixed_dataset):
+        assert mixed_dataset.available_pages() == [
+            "consent",
+            "demograph",
+            "device",
+            "experiment",
+            "feedback",
+            "quiz",
+            "trial",
+        ]
+
+    def test_page_data_df_skips_participants(self, mixed_dataset, probes):
+        df = mixed_dataset.to_page_data_df("trial")
+        assert df["participant_id"].unique().to_list() == ["test-participant-001"]
+        assert "test-participant-pagedata" not in probes
+
+    def test_page_data_dfs_skips_participants(self, mixed_dataset, probes):
+        dfs = mixed_dataset.to_page_data_dfs(["experiment", "missing"])
+        assert dfs["experiment"]["participant_id"].unique().to_list() == [
+            "test-participant-pagedata"
+        ]
+        assert dfs["missing"].is_empty()
+        assert "test-participant-001" not in probes
+
+    def test_page_index_on_view(self, mixed_dataset):
+        view = mixed_dataset[1:]
+        assert "trial" not in view.available_pages()
+        assert view.to_page_data_df("trial").is_empty()
+        assert view.to_page_data_df("quiz")["participant_id"].unique().to_list() == [
+            "test-participant-pagedata"
+        ]
+
+    def test_matches_full_scan(self, sample_dataset):
+        for page_name in sample_dataset.available_pages():
+            assert sample_dataset.to_page_data_df(page_name).equals(
+                page_data_to_df(list(sample_dataset), page_name)
+            )
+
+    def test_forms_df(self, mixed_dataset, probes):
+        df = mixed_dataset.forms_df(["experiment"])
+        assert df["participant_id"].to_list() == ["test-participant-pagedata"]
+        assert "test-participant-001" not in probes
+
+    def test_forms_df_legacy_fields(self, mixed_dataset):
+        df = mixed_dataset.forms_df(["demograph", "device"])
+        assert df.select("participant_id", "form").rows() == [
+            ("test-participant-001", "demograph"),
+            ("test-participant-001", "device"),
+            ("test-participant-pagedata", "demograph"),
+            ("test-participant-pagedata", "device"),
+        ]
+        assert df["gender"].to_list() == ["Male", None, "Female", None]
+
+    def test_forms_df_wide(self, mixed_dataset):
+        df = mixed_dataset.forms_df(["feedback"], layout="wide", categorical=True)
+        assert df["participant_id"].dtype == pl.Enum(mixed_dataset._participant_ids())
+        assert df["feedback_rating"].to_list() == [None, 5]
+
+    def test_invalidate_updates_index(self, mixed_dataset):
+        assert mixed_dataset.to_page_data_df("experiment").height == 3
+        mixed_dataset[0].raw_data["pageData_experiment"] = {
+            "visit_0": {"data": [{"trial": 9}], "timestamps": [1]}
+        }
+        mixed_dataset.invalidate()
+        assert mixed_dataset.to_page_data_df("experiment").height == 4
+
+
+class TestLazyFrames:
+    """Test LazyFrame access to participant and trial tables."""
+
+    def test_to_participants_lazy(self, sample_dataset):
+        lf = sample_dataset.to_participants_lazy()
+        assert isinstance(lf, pl.LazyFrame)
+        assert lf.collect().equals(sample_dataset.to_participants_df())
+
+    def test_to_participants_lazy_keeps_dataset_non_columnar(self, sample_dataset):
+        sample_dataset.to_participants_lazy()
+        assert not sample_dataset.is_columnar
+        sample_dataset[1].raw_data["withdrawn"] = False
+        sample_dataset.invalidate()
+        complete = sum(p.is_complete for p in sample_dataset)
+        assert sample_dataset.complete_count == complete
+        assert sample_dataset.to_participants_lazy().collect()["is_complete"].sum() == complete
+
+    def test_to_participants_lazy_columnar(self, sample_dataset):
+        columnar = sample_dataset.to_columnar()
+        assert columnar.to_participants_lazy().collect().equals(columnar.to_participants_df())
+
+    def test_to_trials_lazy(self, sample_dataset):
+        lf = sample_dataset.to_trials_lazy()
+        assert lf.collect().equals(sample_dataset.to_trials_df())
+        result = lf.filter(pl.col("correct") == 1).select("participant_id", "rt").collect()
+        assert result.columns == ["participant_id", "rt"]
+
+    def test_to_trials_lazy_page(self, sample_dataset):
+        lf = sample_dataset.to_trials_lazy(page="trial", include_participant_id=False)
+        assert lf.collect().equals(sample_dataset.to_page_data_df("trial"))
+
+    def test_trials_lazy_not_retained(self, sample_dataset):
+        """Each call reads the current participants rather than a kept table."""
+        before = sample_dataset.to_trials_lazy().collect().height
+        first = sample_dataset[0]
+        first.raw_data["studyData"] = [*first.study_data, {"trial": 99, "rt": 1.0, "correct": 1}]
+        assert sample_dataset.to_trials_lazy().collect().height == before + 1
@@ -1,11 +1,24 @@
 """Tests for data loading functions."""
 
+import gzip
+import io
 import json
+import lzma
+import sys
 
 import pytest
 
-from smiledata import SmileDataset, load_folder, load_json
-from smiledata.loader import load_latest
+from smiledata import (
+    IncrementalLoader,
+    Participant,
+    SmileDataset,
+    iter_participants,
+    load_folder,
+    load_json,
+)
+from smiledata.backends import available_backends
+from smiledata.lazy import LazyParticipants
+from smiledata.loader import _index_export, _iter_json_array, _parse_in_worker, load_latest
 
 
 class TestLoadJson:
@@ -57,6 +70,269 @@ class TestLoadJson:
         assert len(ds) == 3
 
 
+class TestIterParticipants:
+    """Test streaming participant loading."""
+
+    def test_yields_participants(self, temp_json_file):
+        participants = list(iter_participants(temp_json_file))
+        assert len(participants) == 1
+        assert isinstance(participants[0], Participant)
+        assert participants[0].id == "test-participant-001"
+
+    def test_is_lazy(self, temp_json_file):
+        it = iter_participants(temp_json_file)
+        assert next(it).id == "test-participant-001"
+        with pytest.raises(StopIteration):
+            next(it)
+
+    def test_load_json_stream(self, tmp_path, complete_participant_data):
+        data = [dict(complete_participant_data, id=f"p-{i}") for i in range(5)]
+        file_path = tmp_path / "multi.json"
+        file_path.write_text(json.dumps(data, indent=2))
+
+        ds = load_json(file_path, stream=True)
+        assert [p.id for p in ds] == [f"p-{i}" for i in range(5)]
+        assert ds[0].raw_data == data[0]
+
+    def test_load_json_stream_invalid_json(self, tmp_path):
+        bad_file = tmp_path / "bad.json"
+        bad_file.write_text("not valid json {{{")
+        with pytest.raises(json.JSONDecodeError):
+            load_json(bad_file, stream=True)
+
+    def test_small_chunks_match_json_load(self, complete_participant_data):
+        data = [complete_participant_data, {"id": "x", "n": 12345}, [1, 2], 6789, "s"]
+        text = json.dumps(data, indent=1)
+        assert list(_iter_json_array(io.StringIO(text), chunk_size=7)) == data
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 5])
+    def test_numbers_split_across_chunks(self, chunk_size):
+        text = "[\n 71811.33\n, -1.5e+10, 42, 7e3, true]"
+        assert list(_iter_json_array(io.StringIO(text), chunk_size=chunk_size)) == [
+            71811.33,
+            -1.5e10,
+            42,
+            7000.0,
+            True,
+        ]
+
+    def test_empty_array(self):
+        assert list(_iter_json_array(io.StringIO("  [ \n ]  "))) == []
+
+    def test_truncated_array(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(_iter_json_array(io.StringIO('[{"id": "a"}, {"id": '), chunk_size=4))
+
+    def test_missing_delimiter(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(_iter_json_array(io.StringIO('[{"id": "a"} {"id": "b"}]')))
+
+    def test_extra_data(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(_iter_json_array(io.StringIO('[{"id": "a"}] [')))
+
+
+class TestMemoryMap:
+    """Test memory-mapped loading."""
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_matches_regular_load(self, backend, temp_json_file, complete_participant_data):
+        ds = load_json(temp_json_file, backend=backend, memory_map=True)
+        assert len(ds) == 1
+        assert ds[0].raw_data == complete_participant_data
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_invalid_json(self, backend, tmp_path):
+        bad_file = tmp_path / "bad.json"
+        bad_file.write_text("not valid json {{{")
+        with pytest.raises(json.JSONDecodeError):
+            load_json(bad_file, backend=backend, memory_map=True)
+
+    def test_empty_file(self, tmp_path):
+        empty_file = tmp_path / "empty.json"
+        empty_file.write_bytes(b"")
+        with pytest.raises(json.JSONDecodeError):
+            load_json(empty_file, memory_map=True)
+
+    def test_load_latest(self, temp_json_file):
+        assert len(load_latest(temp_json_file.parent, memory_map=True)) == 1
+
+
+class TestFieldProjection:
+    """Test keeping only selected fields and pages at load time."""
+
+    FIELDS = ("conditions", "consented", "done", "withdrawn")
+
+    def assert_projected(self, p):
+        assert set(p.raw_data) == {
+            "id", "conditions", "consented", "done", "withdrawn", "pageData_quiz"
+        }
+        assert p.is_complete is True
+        assert p.conditions["condition"] == "A"
+        assert p.quiz["score"] == 3
+        assert p.get_page_data("trial") is None
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_load_json(self, backend, temp_json_file):
+        ds = load_json(temp_json_file, backend=backend, fields=self.FIELDS, pages=["quiz"])
+        self.assert_projected(ds[0])
+
+    def test_load_json_memory_map(self, temp_json_file):
+        ds = load_json(temp_json_file, memory_map=True, fields=self.FIELDS, pages=["quiz"])
+        self.assert_projected(ds[0])
+
+    def test_stream(self, temp_json_file):
+        ds = load_json(temp_json_file, stream=True, fields=self.FIELDS, pages=["quiz"])
+        self.assert_projected(ds[0])
+        p = next(iter_participants(temp_json_file, fields=self.FIELDS, pages=["quiz"]))
+        self.assert_projected(p)
+
+    def test_pages_only(self, temp_json_file):
+        ds = load_json(temp_json_file, pages=["trial", "missing"])
+        assert set(ds[0].raw_data) == {"id", "pageData_trial"}
+
+    def test_fields_only(self, temp_json_file):
+        ds = load_json(temp_json_file, fields=["done"])
+        assert set(ds[0].raw_data) == {"id", "done"}
+
+    def test_load_folder(self, temp_json_folder):
+        ds = load_folder(temp_json_folder, fields=["withdrawn"])
+        assert [p.withdrawn for p in ds] == [False, True]
+        assert all(set(p.raw_data) == {"id", "withdrawn"} for p in ds)
+
+    def test_load_latest(self, temp_json_file):
+        ds = load_latest(temp_json_file.parent, fields=self.FIELDS, pages=["quiz"])
+        self.assert_projected(ds[0])
+
+    def test_cache_keeps_projections_apart(self, temp_json_file):
+        full = load_json(temp_json_file, cache=True)
+        load_json(temp_json_file, cache=True, fields=["done"])
+        projected = load_json(temp_json_file, cache=True, fields=["done"])
+        assert set(projected[0].raw_data) == {"id", "done"}
+        assert load_json(temp_json_file, cache=True)[0].raw_data == full[0].raw_data
+
+
+class TestLazyLoading:
+    """Test loading participants lazily from byte offsets."""
+
+    @pytest.fixture
+    def records(self, complete_participant_data):
+        return [
+            dict(complete_participant_data, id=f"p-{i}", note="José ☃ \"quoted\" {[")
+            for i in range(6)
+        ]
+
+    @pytest.fixture
+    def export(self, tmp_path, records):
+        file_path = tmp_path / "export.json"
+        file_path.write_text(json.dumps(records, indent=2, ensure_ascii=False), encoding="utf-8")
+        return file_path
+
+    def test_index_offsets_are_byte_ranges(self, export, records):
+        starts, ends = _index_export(export)
+        raw = export.read_bytes()
+        assert len(starts) == len(records)
+        for start, end, record in zip(starts, ends, records):
+            assert json.loads(raw[start:end]) == record
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_matches_eager_load(self, backend, export, records):
+        ds = load_json(export, lazy=True, backend=backend)
+        assert isinstance(ds._participants, LazyParticipants)
+        assert len(ds) == 6
+        assert [p.raw_data for p in ds] == records
+
+    def test_index_and_slice(self, export):
+        ds = load_json(export, lazy=True)
+        assert ds[-1].id == "p-5"
+        subset = ds[2:4]
+        assert [p.id for p in subset] == ["p-2", "p-3"]
+
+    def test_repr_does_not_decode(self, export):
+        ds = load_json(export, lazy=True)
+        assert repr(ds) == "SmileDataset(n=6)"
+        assert len(ds._participants._cache) == 0
+        assert ds.complete_count == 6
+        assert repr(ds) == "SmileDataset(n=6, complete=6)"
+
+    def test_projection(self, export):
+        ds = load_json(export, lazy=True, fields=["done"], pages=["quiz"])
+        assert set(ds[0].raw_data) == {"id", "done", "pageData_quiz"}
+
+    def test_empty_array(self, tmp_path):
+        empty_file = tmp_path / "empty.json"
+        empty_file.write_text("[]")
+        assert len(load_json(empty_file, lazy=True)) == 0
+
+    def test_invalid_json(self, tmp_path):
+        bad_file = tmp_path / "bad.json"
+        bad_file.write_text("not valid json {{{")
+        with pytest.raises(json.JSONDecodeError):
+            load_json(bad_file, lazy=True)
+
+    def test_load_latest(self, export):
+        assert len(load_latest(export.parent, lazy=True)) == 6
+
+
+def compress(path, suffix):
+    """Write a compressed copy of an export next to it and return its path."""
+    target = path.with_name(path.name + suffix)
+    raw = path.read_bytes()
+    if suffix == ".gz":
+        target.write_bytes(gzip.compress(raw))
+    elif suffix == ".xz":
+        target.write_bytes(lzma.compress(raw))
+    else:
+        zstandard = pytest.importorskip("zstandard")
+        target.write_bytes(zstandard.ZstdCompressor().compress(raw))
+    return target
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".xz", ".zst"])
+class TestCompressedExports:
+    """Test transparent decompression of exports."""
+
+    def test_load_json(self, suffix, temp_json_file, complete_participant_data):
+        ds = load_json(compress(temp_json_file, suffix))
+        assert ds[0].raw_data == complete_participant_data
+
+    def test_iter_participants(self, suffix, temp_json_file):
+        ids = [p.id for p in iter_participants(compress(temp_json_file, suffix))]
+        assert ids == ["test-participant-001"]
+
+    def test_projection(self, suffix, temp_json_file):
+        ds = load_json(compress(temp_json_file, suffix), fields=["done"])
+        assert set(ds[0].raw_data) == {"id", "done"}
+
+    def test_lazy_not_supported(self, suffix, temp_json_file):
+        with pytest.raises(ValueError, match="uncompressed"):
+            load_json(compress(temp_json_file, suffix), lazy=True)
+
+    def test_load_folder_matches_compressed(self, suffix, temp_json_folder):
+        compress(temp_json_folder / "data2.json", suffix)
+        (temp_json_folder / "data2.json").unlink()
+        ds = load_folder(temp_json_folder)
+        assert [p.id for p in ds] == ["test-participant-001", "test-participant-002"]
+
+    def test_load_folder_explicit_pattern(self, suffix, temp_json_folder):
+        compress(temp_json_folder / "data2.json", suffix)
+        assert len(load_folder(temp_json_folder, pattern="data2.json")) == 2
+        assert len(load_folder(temp_json_folder, pattern=f"*{suffix}")) == 1
+
+    def test_load_latest(self, suffix, temp_json_file):
+        compressed = compress(temp_json_file, suffix)
+        temp_json_file.unlink()
+        ds = load_latest(compressed.parent)
+        assert len(ds) == 1
+
+
+def test_zst_without_zstandard(temp_json_file, monkeypatch):
+    compressed = compress(temp_json_file, ".zst")
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    with pytest.raises(ImportError, match="zstandard"):
+        load_json(compressed)
+
+
 class TestLoadFolder:
     """Test load_folder function."""
 
@@ -82,11 +358,132 @@ class TestLoadFolder:
         assert "test-participant-001" in ids
         assert "test-participant-002" in ids
 
+    def test_load_folder_skips_cache(self, temp_json_folder):
+        """Cache files of earlier load_json(cache=True) calls are not exports."""
+        for json_file in sorted(temp_json_folder.glob("*.json")):
+            load_json(json_file, cache=True)
+        stale = temp_json_folder / ".smilecache" / "old.meta.json"
+        stale.write_text(json.dumps({"version": 1}))
+        ds = load_folder(temp_json_folder, pattern="**/*.json")
+        assert len(ds) == 2
+
     def test_load_folder_glob_pattern(self, temp_json_folder):
         """Test glob pattern matching."""
         ds = load_folder(temp_json_folder, pattern="*.json")
         assert len(ds) == 2
 
+    def test_load_folder_workers(self, tmp_path, complete_participant_data):
+        """Parallel parsing keeps the sorted-file participant order."""
+        for i in range(4):
+            data = [dict(complete_participant_data, id=f"file{i}-p{j}") for j in range(2)]
+            (tmp_path / f"data{i}.json").write_text(json.dumps(data))
+
+        ds = load_folder(tmp_path, workers=2)
+        assert [p.id for p in ds] == [f"file{i}-p{j}" for i in range(4) for j in range(2)]
+        ds = load_folder(tmp_path, workers=2, backend="json")
+        assert [p.id for p in ds] == [f"file{i}-p{j}" for i in range(4) for j in range(2)]
+
+    def test_load_folder_workers_mixed(self, tmp_path, complete_participant_data):
+        """Compressed files parsed in workers interleave with files parsed here."""
+        for i in range(4):
+            raw = json.dumps([dict(complete_participant_data, id=f"file{i}")]).encode()
+            if i % 2:
+                (tmp_path / f"data{i}.json.gz").write_bytes(gzip.compress(raw))
+            else:
+                (tmp_path / f"data{i}.json").write_bytes(raw)
+
+        ds = load_folder(tmp_path, workers=2)
+        assert [p.id for p in ds] == [f"file{i}" for i in range(4)]
+
+    def test_parse_in_worker(self, tmp_path):
+        """Only files decoded by the stdlib parser are sent to workers."""
+        assert _parse_in_worker(tmp_path / "a.json.gz", None)
+        assert _parse_in_worker(tmp_path / "a.json", "json")
+        fast = [b for b in available_backends() if b != "json"]
+        if fast:
+            assert not _parse_in_worker(tmp_path / "a.json", fast[0])
+
+    def test_load_folder_logs_parse_times(self, temp_json_folder, caplog):
+        with caplog.at_level("INFO", logger="smiledata.loader"):
+            load_folder(temp_json_folder)
+        messages = [r.getMessage() for r in caplog.records]
+        assert any("data1.json" in m for m in messages)
+        assert any("data2.json" in m for m in messages)
+
+
+class TestIncrementalLoader:
+    """Test incremental folder loading."""
+
+    @staticmethod
+    def write(path, records):
+        path.write_text(json.dumps(records))
+
+    def test_initial_refresh_loads_all(self, temp_json_folder):
+        loader = IncrementalLoader(temp_json_folder)
+        assert len(loader.dataset) == 0
+        ds = loader.refresh()
+        assert len(ds) == 2
+        assert loader.dataset is ds
+        assert [f.name for f in loader.files] == ["data1.json", "data2.json"]
+
+    def test_unchanged_refresh_parses_nothing(self, temp_json_folder, caplog):
+        loader = IncrementalLoader(temp_json_folder)
+        first = loader.refresh()
+        with caplog.at_level("INFO", logger="smiledata.loader"):
+            second = loader.refresh()
+        assert second is first
+        assert not caplog.records
+
+    def test_new_file_only_parses_new_file(
+        self, temp_json_folder, complete_participant_data, caplog
+    ):
+        loader = IncrementalLoader(temp_json_folder)
+        loader.refresh()
+        self.write(temp_json_folder / "data3.json", [dict(complete_participant_data, id="new")])
+
+        with caplog.at_level("INFO", logger="smiledata.loader"):
+            ds = loader.refresh()
+        assert [r.getMessage().split(":")[0] for r in caplog.records] == ["Parsed data3.json"]
+        assert [p.id for p in ds] == ["test-participant-001", "test-participant-002", "new"]
+
+    def test_last_write_wins(self, temp_json_folder, complete_participant_data):
+        loader = IncrementalLoader(temp_json_folder)
+        loader.refresh()
+        updated = dict(complete_participant_data, done=False)
+        self.write(temp_json_folder / "data3.json", [updated])
+
+        ds = loader.refresh()
+        assert len(ds) == 2
+        assert ds[0].id == "test-participant-001"
+        assert ds[0].done is False
+
+    def test_modified_file_is_reparsed(self, tmp_path, complete_participant_data):
+        export = tmp_path / "export.json"
+        self.write(export, [complete_participant_data])
+        loader = IncrementalLoader(tmp_path)
+        loader.refresh()
+
+        self.write(export, [complete_participant_data, dict(complete_participant_data, id="b")])
+        ds = loader.refresh()
+        assert [p.id for p in ds] == ["test-participant-001", "b"]
+
+    def test_duplicates_within_first_load(self, tmp_path, complete_participant_data):
+        self.write(tmp_path / "a.json", [complete_participant_data])
+        self.write(tmp_path / "b.json", [dict(complete_participant_data, trialNum=99)])
+        ds = IncrementalLoader(tmp_path).refresh()
+        assert len(ds) == 1
+        assert ds[0].trial_count == 99
+
+    def test_records_without_id_are_kept(self, tmp_path):
+        self.write(tmp_path / "a.json", [{"done": True}, {"done": False}])
+        assert len(IncrementalLoader(tmp_path).refresh()) == 2
+
+    def test_repr(self, temp_json_folder):
+        loader = IncrementalLoader(temp_json_folder)
+        loader.refresh()
+        assert "files=2" in repr(loader)
+        assert "participants=2" in repr(loader)
+
 
 class TestLoadLatest:
     """Test load_latest function."""
@@ -1,5 +1,7 @@
 """Tests for Participant class."""
 
+import pickle
+
 import polars as pl
 import pytest
 
@@ -275,6 +277,70 @@ class TestParticipantFormAccess:
         assert "visit" not in entries[0]
         assert "index" not in entries[0]
 
+    def test_visits_sorted_numerically(self):
+        """Visits are ordered by number, not by key order or string order."""
+        p = Participant(
+            {
+                "pageData_quiz": {
+                    "visit_10": {"data": [{"score": 10}], "timestamps": [3]},
+                    "visit_2": {"data": [{"score": 2}], "timestamps": [2]},
+                    "visit_0": {"data": [{"score": 0}], "timestamps": [1]},
+                }
+            }
+        )
+        entries = p.get_page_data_entries("quiz")
+        assert [e["visit"] for e in entries] == [0, 2, 10]
+        assert [e["timestamp"] for e in entries] == [1, 2, 3]
+        assert p.quiz["score"] == 10
+
+    def test_last_entry_before_index(self):
+        """The last entry is found numerically before the visit index is built."""
+        p = Participant(
+            {
+                "pageData_quiz": {
+                    "visit_10": {"data": [{"score": 10}]},
+                    "visit_9": {"data": [{"score": 9}]},
+                }
+            }
+        )
+        assert p.quiz["score"] == 10
+        assert p.get_form("quiz", visit=9)["score"] == 9
+        assert p.quiz["score"] == 10
+
+    def test_get_legacy_form(self, complete_participant_data):
+        """Legacy form fields are exposed by form name."""
+        p = Participant(complete_participant_data)
+        assert p.get_legacy_form("demograph") == p.demographics
+        assert p.get_legacy_form("feedback")["comments"] == "Good experiment"
+        assert p.get_legacy_form("quiz") is None
+        p.raw_data["deviceForm"] = {}
+        assert p.get_legacy_form("device") is None
+
+    def test_page_visits(self, complete_participant_data):
+        """page_visits() maps visit numbers to visit records in order."""
+        p = Participant(complete_participant_data)
+        visits = p.page_visits("quiz")
+        assert list(visits) == [0, 1]
+        assert visits[1]["data"][-1] == p.quiz
+        assert p.page_visits("nonexistent") == {}
+
+    def test_empty_last_visit(self):
+        """An empty final visit has no last entry."""
+        p = Participant(
+            {"pageData_quiz": {"visit_0": {"data": [{"score": 1}]}, "visit_1": {}}}
+        )
+        assert p.quiz is None
+        assert len(p.get_page_data_entries("quiz")) == 1
+
+    def test_visit_index_refresh(self, complete_participant_data):
+        """refresh() rebuilds the visit index after raw data changes."""
+        p = Participant(complete_participant_data)
+        assert p.quiz["score"] == 3
+        p.raw_data["pageData_quiz"]["visit_2"] = {"data": [{"score": 4}]}
+        p.refresh()
+        assert p.quiz["score"] == 4
+        assert len(p.get_form("quiz", all_visits=True)) == 3
+
 
 class TestParticipantRouteOrder:
     """Test route order visualization methods."""
@@ -358,3 +424,39 @@ class TestParticipantEdgeCases:
         assert p.id == ""
         assert p.seed_id == ""
         assert p.is_complete is False
+
+
+class TestParticipantSlots:
+    """Test the slotted layout and pre-extracted fields."""
+
+    def test_no_instance_dict(self, participant):
+        assert not hasattr(participant, "__dict__")
+        with pytest.raises(AttributeError):
+            participant.extra = 1
+
+    def test_refresh_after_mutation(self, complete_participant_data):
+        p = Participant(complete_participant_data)
+        p.raw_data["withdrawn"] = True
+        assert p.withdrawn is False
+        p.refresh()
+        assert p.withdrawn is True
+        assert p.is_complete is False
+
+    def test_page_names(self, participant, pagedata_participant):
+        assert participant.page_names == ("consent", "trial", "quiz")
+        assert "experiment" in pagedata_participant.page_names
+        assert Participant({"id": "none"}).page_names == ()
+
+    def test_page_names_refresh(self, complete_participant_data):
+        p = Participant(complete_participant_data)
+        assert "extra" not in p.page_names
+        p.raw_data["pageData_extra"] = {}
+        p.refresh()
+        assert p.page_names[-1] == "extra"
+        assert "pageData_extra" in p.get_all_page_data()
+
+    def test_pickle_round_trip(self, participant):
+        restored = pickle.loads(pickle.dumps(participant))
+        assert restored.id == participant.id
+        assert restored.is_complete == participant.is_complete
+        assert restored.raw_data == participant.raw_data
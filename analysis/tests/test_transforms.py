@@ -5,11 +5,17 @@ import pytest
 
 from smiledata import Participant
 from smiledata.transforms import (
+    ColumnBuffers,
     conditions_to_df,
     demographics_to_df,
+    downcast_df,
+    encode_categoricals,
     flatten_nested,
+    forms_to_df,
     page_data_to_df,
+    page_data_to_dfs,
     study_data_to_df,
+    unnest_paths,
 )
 
 
@@ -111,6 +117,316 @@ class TestPageDataToDf:
         df = page_data_to_df([], "trial")
         assert len(df) == 0
 
+    def test_matches_row_construction(self, complete_participant_data):
+        data = complete_participant_data.copy()
+        data["pageData_trial"]["visit_1"] = {
+            "timestamps": [],
+            "data": [{"response": "C", "rt": 600.5, "extra": True}],
+        }
+        rows = []
+        for visit_key, visit in data["pageData_trial"].items():
+            for i, entry in enumerate(visit["data"]):
+                row = {"participant_id": data["id"], "visit": int(visit_key[6:]), "index": i}
+                if i < len(visit["timestamps"]):
+                    row["timestamp"] = visit["timestamps"][i]
+                rows.append({**row, **entry})
+
+        df = page_data_to_df([Participant(data)], "trial")
+        assert df.equals(pl.DataFrame(rows))
+
+    def test_entry_keys_override_visit_info(self, complete_participant_data):
+        data = complete_participant_data.copy()
+        data["pageData_trial"] = {"visit_0": {"data": [{"index": "custom"}, {"rt": 1}]}}
+        df = page_data_to_df([Participant(data)], "trial")
+        assert df["index"].to_list() == ["custom", "1"]
+        assert "timestamp" not in df.columns
+
+
+class TestSchemaControl:
+    """Test schema, schema_overrides and downcast options."""
+
+    def test_schema_selects_and_types_columns(self, complete_participant_data):
+        participants = [Participant(complete_participant_data)]
+        df = study_data_to_df(
+            participants, schema={"participant_id": pl.String, "rt": pl.Float32, "missing": pl.Int8}
+        )
+        assert df.schema == pl.Schema(
+            {"participant_id": pl.String, "rt": pl.Float32, "missing": pl.Int8}
+        )
+        assert df["rt"].to_list() == [500.0, 450.0, 600.0]
+        assert df["missing"].null_count() == 3
+
+    def test_schema_without_rows(self):
+        df = study_data_to_df([], schema={"rt": pl.Float64})
+        assert df.schema == pl.Schema({"rt": pl.Float64})
+
+    def test_schema_overrides(self, complete_participant_data):
+        participants = [Participant(complete_participant_data)]
+        df = page_data_to_df(participants, "trial", schema_overrides={"rt": pl.Float64})
+        assert df.schema["rt"] == pl.Float64
+        assert df.columns == page_data_to_df(participants, "trial").columns
+
+    def test_schema_type_mismatch(self, complete_participant_data):
+        participants = [Participant(complete_participant_data)]
+        with pytest.raises(TypeError):
+            study_data_to_df(participants, schema_overrides={"response": pl.Int64})
+
+    def test_inferred_across_participants(self, complete_participant_data):
+        later = {**complete_participant_data, "id": "later", "studyData": [{"rt": 512.5}]}
+        participants = [Participant(complete_participant_data), Participant(later)]
+        df = study_data_to_df(participants)
+        assert df.schema["rt"] == pl.Float64
+        assert df["rt"].to_list()[-1] == 512.5
+
+    def test_participant_id_overrides_trial_field(self, complete_participant_data):
+        data = {**complete_participant_data, "studyData": [{"participant_id": "x", "rt": 1}]}
+        df = study_data_to_df([Participant(data)])
+        assert df.columns == ["participant_id", "rt"]
+        assert df["participant_id"].to_list() == [data["id"]]
+
+    def test_downcast(self, complete_participant_data):
+        participants = [Participant(complete_participant_data)]
+        df = study_data_to_df(participants, downcast=True, schema_overrides={"rt": pl.Int64})
+        assert df.schema["correct"] == pl.Int32
+        assert df.schema["rt"] == pl.Int64
+        assert df.schema["id"] == pl.Categorical
+        assert df.schema["participant_id"] == pl.Categorical
+        assert df.cast({"id": pl.String}).equals(
+            study_data_to_df(participants).cast({"id": pl.String}).select(df.columns)
+        )
+
+
+class TestDowncastDf:
+    """Test downcast_df function."""
+
+    def test_integers(self):
+        df = downcast_df(
+            pl.DataFrame({"a": [0, 100], "b": [-1000, 1000], "c": [0, 2**40], "d": [None, 70000]})
+        )
+        assert df.schema == pl.Schema(
+            {"a": pl.Int32, "b": pl.Int32, "c": pl.Int64, "d": pl.Int32}
+        )
+
+    def test_strings(self):
+        df = downcast_df(pl.DataFrame({"few": ["x", "x", "y", "x"], "many": ["a", "b", "c", "d"]}))
+        assert df.schema["few"] == pl.Categorical
+        assert df.schema["many"] == pl.String
+
+    def test_floats_and_exclude(self):
+        df = downcast_df(pl.DataFrame({"f": [0.5], "i": [1]}), exclude=["i"])
+        assert df.schema == pl.Schema({"f": pl.Float64, "i": pl.Int64})
+
+    def test_empty(self):
+        assert downcast_df(pl.DataFrame()).shape == (0, 0)
+
+
+class TestEncodeCategoricals:
+    """Test encode_categoricals function."""
+
+    @pytest.fixture
+    def df(self):
+        return pl.DataFrame(
+            {
+                "participant_id": ["p1", "p1", "p2", "p2"],
+                "response": ["left", "right", "left", "left"],
+                "note": ["a", "b", "c", "d"],
+                "rt": [1, 2, 3, 4],
+            }
+        )
+
+    def test_default_columns(self, df):
+        encoded = encode_categoricals(df)
+        assert encoded.schema["participant_id"] == pl.Enum(["p1", "p2"])
+        assert encoded.schema["response"] == pl.Categorical
+        assert encoded.schema["note"] == pl.String
+        assert encoded.schema["rt"] == pl.Int64
+        assert encoded.cast(pl.String).equals(df.cast(pl.String))
+
+    def test_named_columns(self, df):
+        encoded = encode_categoricals(df, ["note", "absent"], ids=["p0", "p1", "p2"])
+        assert encoded.schema["note"] == pl.Categorical
+        assert encoded.schema["participant_id"] == pl.String
+
+    def test_shared_id_enum(self, df):
+        ids = ["p1", "p2", "p3"]
+        trials = encode_categoricals(df, ids=ids)
+        people = encode_categoricals(
+            pl.DataFrame({"participant_id": ["p3", "p1"], "age": [30, 40]}), ids=ids
+        )
+        joined = trials.join(people, on="participant_id")
+        assert joined["age"].to_list() == [40, 40]
+
+    def test_categoricals_join_across_frames(self, df):
+        a = encode_categoricals(df, ["response"])
+        b = encode_categoricals(pl.DataFrame({"response": ["right"], "key": [1]}), ["response"])
+        assert a.join(b, on="response")["rt"].to_list() == [2]
+
+    def test_disabled(self, df):
+        assert encode_categoricals(df, False) is df
+
+
+class TestPageDataToDfs:
+    """Test page_data_to_dfs function."""
+
+    def test_matches_page_data_to_df(self, complete_participant_data):
+        participants = [Participant(complete_participant_data)]
+        dfs = page_data_to_dfs(participants, ["trial", "nonexistent"])
+        assert dfs["trial"].equals(page_data_to_df(participants, "trial"))
+        assert len(dfs["nonexistent"]) == 0
+
+    def test_all_pages(self, complete_participant_data):
+        participants = [Participant(complete_participant_data)]
+        dfs = page_data_to_dfs(participants)
+        assert list(dfs) == sorted(dfs)
+        assert "trial" in dfs
+
+
+class TestFormsToDf:
+    """Test forms_to_df function."""
+
+    @pytest.fixture
+    def participants(self, complete_participant_data, pagedata_only_participant_data):
+        return [
+            Participant(complete_participant_data),
+            Participant(pagedata_only_participant_data),
+        ]
+
+    def test_long_last(self, participants):
+        df = forms_to_df(participants, ["quiz", "demograph"])
+        assert df.columns[:5] == ["participant_id", "form", "visit", "index", "timestamp"]
+        assert df.select("participant_id", "form", "visit").rows() == [
+            ("test-participant-001", "quiz", 1),
+            ("test-participant-001", "demograph", None),
+            ("test-participant-pagedata", "quiz", 1),
+            ("test-participant-pagedata", "demograph", 0),
+        ]
+        assert df["score"].to_list() == [3, None, 3, None]
+        assert df["gender"].to_list() == [None, "Male", None, "Female"]
+
+    def test_matches_accessors(self, participants):
+        df = forms_to_df(participants, ["quiz", "device"])
+        assert df.height == 4
+        for row in df.iter_rows(named=True):
+            entry = next(p for p in participants if p.id == row["participant_id"])
+            if row["form"] == "device":
+                expected = entry.device_info
+            else:
+                expected = entry.get_form(row["form"])
+            assert {k: row[k] for k in expected} == expected
+
+    def test_column_order_without_timestamps(self, participants):
+        """Legacy rows and visits without timestamps still lead with the key columns."""
+        untimed = Participant(
+            {"id": "untimed", "pageData_survey": {"visit_0": {"data": [{"s": 1}]}}}
+        )
+        for forms, people in [(["demograph"], participants), (["survey"], [untimed])]:
+            for which in ("last", "all"):
+                df = forms_to_df(people, forms, which=which)
+                assert df.columns[:5] == ["participant_id", "form", "visit", "index", "timestamp"]
+
+    def test_legacy_form_replaces_page_data(self, complete_participant_data):
+        complete_participant_data["pageData_feedback"] = {
+            "visit_0": {"data": [{"difficulty": "easy"}], "timestamps": [1]}
+        }
+        participants = [Participant(complete_participant_data)]
+        for which in ("last", "all"):
+            df = forms_to_df(participants, ["feedback"], which=which)
+            assert df.select("visit", "index", "difficulty").rows() == [
+                (None, None, "moderate")
+            ]
+
+    def test_long_all(self, participants):
+        df = forms_to_df(participants, ["quiz"], which="all")
+        expected = [
+            (p.id, e["visit"], e["index"], e["timestamp"])
+            for p in participants
+            for e in p.get_form("quiz", all_visits=True)
+        ]
+        assert df.select("participant_id", "visit", "index", "timestamp").rows() == expected
+
+    def test_wide(self, participants):
+        df = forms_to_df(participants, ["demograph", "quiz"], layout="wide")
+        assert df.height == 2
+        assert df.columns[0] == "participant_id"
+        assert df["demograph_gender"].to_list() == ["Male", "Female"]
+        assert df["quiz_score"].to_list() == [3, 3]
+
+    def test_missing_form(self, participants):
+        assert forms_to_df(participants, ["nonexistent"]).is_empty()
+        wide = forms_to_df(participants, ["nonexistent"], layout="wide")
+        assert wide.columns == ["participant_id"]
+        assert wide.height == 2
+
+    def test_invalid_options(self, participants):
+        with pytest.raises(ValueError, match="which"):
+            forms_to_df(participants, ["quiz"], which="first")
+        with pytest.raises(ValueError, match="layout"):
+            forms_to_df(participants, ["quiz"], layout="tall")
+        with pytest.raises(ValueError, match="wide"):
+            forms_to_df(participants, ["quiz"], which="all", layout="wide")
+
+
+class TestColumnBuffers:
+    """Test ColumnBuffers."""
+
+    def test_missing_keys_are_null(self):
+        buffers = ColumnBuffers()
+        buffers.extend([{"a": 1, "b": "x"}, {"a": 2}])
+        buffers.append({"c": 3.5})
+        assert len(buffers) == 3
+        assert buffers.to_frame().to_dicts() == [
+            {"a": 1, "b": "x", "c": None},
+            {"a": 2, "b": None, "c": None},
+            {"a": None, "b": None, "c": 3.5},
+        ]
+
+    def test_fields_come_first_and_records_win(self):
+        buffers = ColumnBuffers()
+        buffers.extend([{"a": 1}, {"a": 2, "id": "own"}], {"id": ["p", "p"]})
+        df = buffers.to_frame()
+        assert df.columns == ["id", "a"]
+        assert df["id"].to_list() == ["p", "own"]
+
+    def test_types_inferred_from_all_values(self):
+        buffers = ColumnBuffers()
+        buffers.extend([{"x": 1}] * 200 + [{"x": 2.5, "late": "y"}])
+        df = buffers.to_frame()
+        assert df["x"].dtype == pl.Float64
+        assert df["late"].to_list()[-1] == "y"
+
+    def test_mixed_types_become_strings(self):
+        buffers = ColumnBuffers()
+        buffers.extend([{"x": 1}, {"x": "a"}])
+        assert buffers.to_frame()["x"].to_list() == ["1", "a"]
+
+    def test_nested_values_keep_all_keys(self):
+        buffers = ColumnBuffers()
+        buffers.extend([{"s": {"a": 1}}, {"s": {"b": 2}}])
+        assert buffers.to_frame()["s"].to_list() == [{"a": 1, "b": None}, {"a": None, "b": 2}]
+
+    @pytest.mark.parametrize(
+        "values",
+        [[{"a": 1}, [1]], ["x", {"a": 1}], [[1], None, {"a": 1}], [1, [1]]],
+    )
+    def test_mixed_containers_kept_as_objects(self, values):
+        buffers = ColumnBuffers()
+        buffers.extend([{"v": value} for value in values])
+        column = buffers.to_frame()["v"]
+        assert column.dtype == pl.Object
+        assert column.to_list() == values
+
+    def test_columns_resumed_after_gaps(self):
+        buffers = ColumnBuffers()
+        buffers.append({"a": 1})
+        buffers.extend([{"b": 2}, {"b": 3}])
+        buffers.append({"a": 4})
+        df = buffers.to_frame()
+        assert df["a"].to_list() == [1, None, None, 4]
+        assert df["b"].to_list() == [None, 2, 3, None]
+
+    def test_empty(self):
+        assert ColumnBuffers().to_frame().shape == (0, 0)
+
 
 class TestConditionsToDf:
     """Test conditions_to_df function."""
@@ -163,3 +479,63 @@ class TestFlattenNested:
         """Lists should be kept as-is, not flattened."""
         result = flatten_nested({"a": [1, 2, 3]})
         assert result == {"a": [1, 2, 3]}
+
+    def test_empty_nested_dict_dropped(self):
+        result = flatten_nested({"a": {}, "b": 1})
+        assert result == {"b": 1}
+
+    def test_depth_first_order(self):
+        result = flatten_nested({"a": {"b": 1, "c": {"d": 2}}, "e": 3, "f": {"g": 4}})
+        assert list(result) == ["a.b", "a.c.d", "e", "f.g"]
+
+    def test_very_deep_nesting(self):
+        """Nesting deeper than the recursion limit is flattened."""
+        data: dict = {"leaf": 1}
+        for _ in range(5000):
+            data = {"n": data}
+        result = flatten_nested(data)
+        assert list(result.values()) == [1]
+        assert next(iter(result)).count(".") == 5000
+
+
+class TestUnnestPaths:
+    """Test unnest_paths function."""
+
+    @pytest.fixture
+    def df(self):
+        return pl.DataFrame(
+            {
+                "rt": [500, 450],
+                "persist": [
+                    {"attempts": 1, "state": {"level": 2, "ok": True}},
+                    {"attempts": 2, "state": {"level": 3, "ok": False}},
+                ],
+            }
+        )
+
+    def test_field(self, df):
+        result = unnest_paths(df, ["persist.attempts"])
+        assert result.columns == ["rt", "persist", "persist.attempts"]
+        assert result["persist.attempts"].to_list() == [1, 2]
+
+    def test_struct_expands_to_leaves(self, df):
+        result = unnest_paths(df, ["persist.state"])
+        assert result.columns[2:] == ["persist.state.level", "persist.state.ok"]
+
+    def test_matches_flatten_nested(self, df):
+        result = unnest_paths(df, ["persist"]).drop("persist")
+        expected = pl.DataFrame([flatten_nested(row) for row in df.to_dicts()])
+        assert result.equals(expected)
+
+    def test_dotted_column_name(self, df):
+        df = df.rename({"persist": "page.persist"})
+        result = unnest_paths(df, ["page.persist.attempts"])
+        assert result["page.persist.attempts"].to_list() == [1, 2]
+
+    def test_unknown_path(self, df):
+        with pytest.raises(ValueError, match="column name"):
+            unnest_paths(df, ["missing.field"])
+        with pytest.raises(ValueError, match="not a field"):
+            unnest_paths(df, ["persist.missing"])
+        with pytest.raises(ValueError, match="not a field"):
+            unnest_paths(df, ["rt.value"])